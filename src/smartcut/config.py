@@ -1,12 +1,22 @@
 """Configuration and settings for SmartCut MCP Server."""
 
 import platform
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+# Default CapCut drafts location per OS (platform.system() value)
+_HOME = Path.home()
+_DRAFTS_PATH_BY_SYSTEM = {
+    "Darwin": _HOME / "Movies" / "CapCut" / "User Data" / "Projects" / "com.lveditor.draft",
+    "Windows": _HOME / "AppData" / "Local" / "CapCut" / "User Data" / "Projects" / "com.lveditor.draft",
+}
+# Linux or other - use current directory
+_DEFAULT_DRAFTS_PATH = Path.cwd() / "capcut_drafts"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -27,22 +37,18 @@ class Settings(BaseSettings):
         default="capcut", alias="SMARTCUT_ALLOWED_TARGETS"
     )
 
+    # Pretty-print tool responses (debugging); compact JSON by default
+    pretty_json: bool = Field(default=False, alias="SMARTCUT_PRETTY_JSON")
+
     model_config = {"env_file": ".env", "extra": "ignore"}
 
-    def get_capcut_drafts_path(self) -> Path:
-        """Get CapCut drafts directory path, auto-detecting if not set."""
+    @cached_property
+    def capcut_drafts_path(self) -> Path:
+        """CapCut drafts directory path, auto-detected if not set (resolved once)."""
         if self.capcut_drafts_dir:
             return Path(self.capcut_drafts_dir)
 
-        system = platform.system()
-        if system == "Darwin":  # macOS
-            return Path.home() / "Movies" / "CapCut" / "User Data" / "Projects" / "com.lveditor.draft"
-        elif system == "Windows":
-            local_app_data = Path.home() / "AppData" / "Local"
-            return local_app_data / "CapCut" / "User Data" / "Projects" / "com.lveditor.draft"
-        else:
-            # Linux or other - use current directory
-            return Path.cwd() / "capcut_drafts"
+        return _DRAFTS_PATH_BY_SYSTEM.get(platform.system(), _DEFAULT_DRAFTS_PATH)
 
 
 # Default constants
@@ -58,8 +64,13 @@ LLM_MODEL = "gpt-4o-mini"
 MICROSECONDS_PER_SECOND = 1_000_000
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get cached settings instance."""
+    """Get cached settings instance.
+
+    Settings are read once per process; call ``get_settings.cache_clear()``
+    to force a reload (e.g. after changing environment variables).
+    """
     return Settings()
 
 
@@ -0,0 +1,89 @@
+"""Local keyword scoring for picking subtitle accent words without an LLM."""
+
+import math
+import re
+from collections import Counter
+from typing import Iterable, Optional
+
+# Common Russian and English function words that are never worth accenting
+STOPWORDS = frozenset(
+    """
+    и в во не что он на я с со как а то все она так его но да ты к у же вы за бы по
+    только ее мне было вот от меня еще нет о из ему теперь когда даже ну вдруг ли если
+    уже или ни быть был него до вас нибудь опять уж вам ведь там потом себя ничего ей
+    может они тут где есть надо ней для мы тебя их чем была сам чтоб без будто чего раз
+    тоже себе под будет ж тогда кто этот того потому этого какой совсем ним здесь этом
+    один почти мой тем чтобы нее сейчас были куда зачем всех никогда можно при наконец
+    два об другой хоть после над больше тот через эти нас про всего них какая много
+    разве три эту моя впрочем хорошо свою этой перед иногда лучше чуть том нельзя такой
+    им более всегда конечно всю между это эта эти вот просто очень
+    a an the and or but if then so to of in on at by for with from as is are was were
+    be been being am do does did have has had it its this that these those i you he she
+    we they me him her us them my your his our their what which who whom not no yes
+    can will just very also there here about into out up down than too only own same
+    """.split()
+)
+
+_WORD_RE = re.compile(r"\w[\w'-]*")
+
+
+def _tokens(text: str) -> list[str]:
+    """Split text into words as they appear (punctuation stripped)."""
+    return _WORD_RE.findall(text)
+
+
+def build_idf(texts: Iterable[str]) -> dict[str, float]:
+    """
+    Build an inverse document frequency table over a set of texts.
+
+    Args:
+        texts: Documents, e.g. all subtitle lines of a transcript.
+
+    Returns:
+        Mapping of lowercased word to smoothed IDF weight.
+    """
+    doc_freq: Counter[str] = Counter()
+    n_docs = 0
+    for text in texts:
+        n_docs += 1
+        doc_freq.update({token.lower() for token in _tokens(text)})
+    return {word: math.log((1 + n_docs) / (1 + df)) + 1.0 for word, df in doc_freq.items()}
+
+
+def pick_accent_words(
+    text: str,
+    idf: Optional[dict[str, float]] = None,
+    max_words: int = 4,
+) -> list[str]:
+    """
+    Pick the most significant words in a subtitle line.
+
+    Words are scored by term frequency * IDF * length, so rare, long content
+    words win over short and common ones; stopwords are never picked.
+
+    Args:
+        text: Subtitle text.
+        idf: IDF table from build_idf (all words weigh 1.0 if omitted).
+        max_words: Maximum number of words to return.
+
+    Returns:
+        Accent words exactly as they appear in the text, in text order.
+    """
+    candidates: dict[str, str] = {}  # lowercased -> first original form
+    term_freq: Counter[str] = Counter()
+    for token in _tokens(text):
+        key = token.lower()
+        if key in STOPWORDS or len(key) < 3 or key.isdigit():
+            continue
+        candidates.setdefault(key, token)
+        term_freq[key] += 1
+
+    idf = idf or {}
+    ranked = sorted(
+        candidates,
+        key=lambda key: term_freq[key] * idf.get(key, 1.0) * len(key),
+        reverse=True,
+    )[:max_words]
+
+    chosen = set(ranked)
+    return [candidates[key] for key in candidates if key in chosen]
@@ -1,37 +1,57 @@
 """Auphonic API client for audio enhancement."""
 
+import asyncio
 import time
 from pathlib import Path
 from typing import Optional
 
 import httpx
+import orjson
 
 AUPHONIC_API_BASE = "https://auphonic.com/api"
-POLL_INTERVAL_SEC = 5
-MAX_POLL_ATTEMPTS = 120  # 10 minutes max
+POLL_INTERVAL_SEC = 1.0  # First wait; grows by POLL_BACKOFF_FACTOR up to POLL_MAX_INTERVAL_SEC
+POLL_MAX_INTERVAL_SEC = 15.0
+POLL_BACKOFF_FACTOR = 1.5
+POLL_TIMEOUT_SEC = 600  # 10 minutes max
+STATUS_CACHE_TTL_SEC = 0.5  # Below POLL_INTERVAL_SEC so a poller never sees its own stale status
+STATUS_CACHE_MAX_ENTRIES = 64
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_MAX_RETRIES = 3
+
+
+def _parse_json(response: httpx.Response) -> dict:
+    """Parse a JSON response body with orjson."""
+    return orjson.loads(response.content)
 
 
 class ProductionStatus:
     """Auphonic production status."""
 
+    __slots__ = ("code", "status_string", "error_message", "data")
+
     INCOMPLETE = 0
     QUEUED = 1
     IN_PROGRESS = 2
     DONE = 3
     ERROR = 4
 
-    STATUS_NAMES = {
-        0: "incomplete",
-        1: "queued",
-        2: "in_progress",
-        3: "done",
-        4: "error",
-    }
+    # Indexed by status code
+    STATUS_NAMES = ("incomplete", "queued", "in_progress", "done", "error")
 
-    def __init__(self, status_code: int, status_string: str = "", error_message: str = ""):
+    def __init__(
+        self,
+        status_code: int,
+        status_string: str = "",
+        error_message: str = "",
+        data: Optional[dict] = None,
+    ):
         self.code = status_code
-        self.status_string = status_string or self.STATUS_NAMES.get(status_code, "unknown")
+        if not status_string:
+            names = self.STATUS_NAMES
+            status_string = names[status_code] if 0 <= status_code < len(names) else "unknown"
+        self.status_string = status_string
         self.error_message = error_message
+        self.data = data or {}  # Raw production JSON this status was built from
 
     @property
     def is_done(self) -> bool:
@@ -54,8 +74,33 @@ class AuphonicClient:
             raise ValueError("Auphonic API key is required")
         self.api_key = api_key
         self.headers = {"Authorization": f"Bearer {api_key}"}
-
-    def create_production(
+        # One pooled HTTP/2 client for all calls so polling reuses the same connection.
+        # Keep-alive outlasts the longest poll interval; retries cover transient connect errors.
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=90),
+        )
+        self._client = httpx.AsyncClient(
+            base_url=AUPHONIC_API_BASE,
+            headers=self.headers,
+            transport=transport,
+            timeout=httpx.Timeout(300.0, connect=10.0),
+        )
+        # production UUID -> (fetch time, status); coalesces concurrent polls of one production
+        self._status_cache: dict[str, tuple[float, ProductionStatus]] = {}
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AuphonicClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def create_production(
         self,
         audio_path: Path,
         preset_uuid: Optional[str] = None,
@@ -72,31 +117,30 @@ class AuphonicClient:
         Returns:
             Production UUID.
         """
-        with httpx.Client(timeout=300) as client:
-            # Create production with file upload
-            files = {"input_file": open(audio_path, "rb")}
-            data = {
-                "title": title,
-                "action": "start",
-            }
-            if preset_uuid:
-                data["preset"] = preset_uuid
-
-            response = client.post(
-                f"{AUPHONIC_API_BASE}/simple/productions.json",
-                headers=self.headers,
+        data = {
+            "title": title,
+            "action": "start",
+        }
+        if preset_uuid:
+            data["preset"] = preset_uuid
+
+        # Create production with file upload
+        with audio_path.open("rb") as audio_file:
+            files = {"input_file": (audio_path.name, audio_file, "application/octet-stream")}
+            response = await self._client.post(
+                "/simple/productions.json",
                 files=files,
                 data=data,
             )
-            response.raise_for_status()
+        response.raise_for_status()
 
-            result = response.json()
-            if result.get("status_code") != 200:
-                raise RuntimeError(f"Auphonic API error: {result.get('error_message', 'Unknown error')}")
+        result = _parse_json(response)
+        if result.get("status_code") != 200:
+            raise RuntimeError(f"Auphonic API error: {result.get('error_message', 'Unknown error')}")
 
-            return result["data"]["uuid"]
+        return result["data"]["uuid"]
 
-    def get_status(self, production_uuid: str) -> ProductionStatus:
+    async def get_status(self, production_uuid: str) -> ProductionStatus:
         """
         Get production status.
 
@@ -106,45 +150,81 @@ class AuphonicClient:
         Returns:
             ProductionStatus object.
         """
-        with httpx.Client(timeout=30) as client:
-            response = client.get(
-                f"{AUPHONIC_API_BASE}/production/{production_uuid}.json",
-                headers=self.headers,
-            )
-            response.raise_for_status()
+        cached = self._status_cache.get(production_uuid)
+        if cached is not None and time.monotonic() - cached[0] < STATUS_CACHE_TTL_SEC:
+            return cached[1]
 
-            result = response.json()
-            data = result.get("data", {})
+        data = await self._fetch_production(production_uuid)
 
-            return ProductionStatus(
-                status_code=data.get("status", 0),
-                status_string=data.get("status_string", ""),
-                error_message=data.get("error_message", ""),
-            )
+        status = ProductionStatus(
+            status_code=data.get("status", 0),
+            status_string=data.get("status_string", ""),
+            error_message=data.get("error_message", ""),
+            data=data,
+        )
+
+        self._status_cache.pop(production_uuid, None)
+        if status.is_pending:
+            self._cache_status(production_uuid, status)
+
+        return status
 
-    def poll_until_done(
+    def _cache_status(self, production_uuid: str, status: ProductionStatus) -> None:
+        """
+        Cache a pending status, keeping the cache bounded.
+
+        Expired entries are pruned on insert, so abandoned or timed-out
+        productions don't linger; past STATUS_CACHE_MAX_ENTRIES the oldest go first.
+        """
+        now = time.monotonic()
+        cache = self._status_cache
+        for uuid in [u for u, (cached_at, _) in cache.items() if now - cached_at >= STATUS_CACHE_TTL_SEC]:
+            del cache[uuid]
+        while len(cache) >= STATUS_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]  # Dicts keep insertion order, oldest first
+        cache[production_uuid] = (now, status)
+
+    async def _fetch_production(self, production_uuid: str) -> dict:
+        """Fetch raw production details ("data" field of the API response)."""
+        response = await self._client.get(
+            f"/production/{production_uuid}.json",
+            timeout=30,
+        )
+        response.raise_for_status()
+
+        return _parse_json(response).get("data", {})
+
+    async def poll_until_done(
         self,
         production_uuid: str,
-        poll_interval: int = POLL_INTERVAL_SEC,
-        max_attempts: int = MAX_POLL_ATTEMPTS,
+        poll_interval: float = POLL_INTERVAL_SEC,
+        max_interval: float = POLL_MAX_INTERVAL_SEC,
+        timeout: float = POLL_TIMEOUT_SEC,
     ) -> ProductionStatus:
         """
         Poll production status until completion.
 
+        The first check happens immediately; after that the wait between polls
+        grows exponentially so short jobs finish fast and long jobs poll less.
+
         Args:
             production_uuid: Production UUID.
-            poll_interval: Seconds between polls.
-            max_attempts: Maximum poll attempts.
+            poll_interval: Initial seconds between polls.
+            max_interval: Upper bound for seconds between polls.
+            timeout: Maximum total seconds to wait.
 
         Returns:
             Final ProductionStatus.
 
         Raises:
-            TimeoutError: If max attempts exceeded.
+            TimeoutError: If timeout exceeded.
             RuntimeError: If production failed.
         """
-        for _ in range(max_attempts):
-            status = self.get_status(production_uuid)
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+
+        while True:
+            status = await self.get_status(production_uuid)
 
             if status.is_done:
                 return status
@@ -152,14 +232,20 @@ class AuphonicClient:
             if status.is_error:
                 raise RuntimeError(f"Auphonic production failed: {status.error_message}")
 
-            time.sleep(poll_interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * POLL_BACKOFF_FACTOR, max_interval)
 
-        raise TimeoutError(f"Auphonic production timed out after {max_attempts * poll_interval} seconds")
+        raise TimeoutError(f"Auphonic production timed out after {timeout:.0f} seconds")
 
-    def download_result(
+    async def download_result(
         self,
         production_uuid: str,
         output_path: Path,
+        production_data: Optional[dict] = None,
     ) -> Path:
         """
         Download enhanced audio file.
@@ -167,37 +253,56 @@ class AuphonicClient:
         Args:
             production_uuid: Production UUID.
             output_path: Path to save the file.
+            production_data: Production details already fetched (e.g. by the last
+                poll). Fetched from the API if not provided.
 
         Returns:
             Path to downloaded file.
         """
-        with httpx.Client(timeout=300) as client:
-            # Get production details to find output file URL
-            response = client.get(
-                f"{AUPHONIC_API_BASE}/production/{production_uuid}.json",
-                headers=self.headers,
-            )
-            response.raise_for_status()
-
-            result = response.json()
-            output_files = result.get("data", {}).get("output_files", [])
-
-            if not output_files:
-                raise RuntimeError("No output files available")
-
-            # Download the first output file
-            download_url = output_files[0].get("download_url")
-            if not download_url:
-                raise RuntimeError("No download URL available")
-
-            # Download file
-            response = client.get(download_url, headers=self.headers)
-            response.raise_for_status()
-
-            output_path.write_bytes(response.content)
-            return output_path
-
-    def enhance_audio(
+        # Get production details to find output file URL
+        if not production_data:
+            production_data = await self._fetch_production(production_uuid)
+
+        output_files = production_data.get("output_files", [])
+
+        if not output_files:
+            raise RuntimeError("No output files available")
+
+        # Download the first output file
+        download_url = output_files[0].get("download_url")
+        if not download_url:
+            raise RuntimeError("No download URL available")
+        expected_size = output_files[0].get("size")
+
+        # Stream file to disk in chunks; on a dropped connection resume with a Range request
+        offset = 0
+        with output_path.open("wb") as f:
+            for attempt in range(DOWNLOAD_MAX_RETRIES + 1):
+                headers = {"Range": f"bytes={offset}-"} if offset else None
+                try:
+                    async with self._client.stream("GET", download_url, headers=headers) as response:
+                        response.raise_for_status()
+                        if offset and response.status_code != 206:
+                            # Server ignored the range - start over
+                            f.seek(0)
+                            f.truncate()
+                            offset = 0
+                        async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            offset += len(chunk)
+                    break
+                except (httpx.RemoteProtocolError, httpx.ReadError, httpx.ReadTimeout) as e:
+                    if attempt == DOWNLOAD_MAX_RETRIES:
+                        raise RuntimeError(
+                            f"Download failed after {DOWNLOAD_MAX_RETRIES + 1} attempts: {e}"
+                        ) from e
+
+        if isinstance(expected_size, int) and offset != expected_size:
+            raise RuntimeError(f"Incomplete download: got {offset} of {expected_size} bytes")
+
+        return output_path
+
+    async def enhance_audio(
         self,
         audio_path: Path,
         output_path: Path,
@@ -214,6 +319,33 @@ class AuphonicClient:
         Returns:
             Path to enhanced audio file.
         """
-        production_uuid = self.create_production(audio_path, preset_uuid)
-        self.poll_until_done(production_uuid)
-        return self.download_result(production_uuid, output_path)
+        production_uuid = await self.create_production(audio_path, preset_uuid)
+        status = await self.poll_until_done(production_uuid)
+        return await self.download_result(production_uuid, output_path, status.data)
+
+    async def enhance_audio_many(
+        self,
+        files: list[tuple[Path, Path]],
+        preset_uuid: Optional[str] = None,
+        concurrency: int = 4,
+    ) -> list[Path]:
+        """
+        Enhance several audio files concurrently.
+
+        Args:
+            files: List of (input audio path, output path) pairs.
+            preset_uuid: Auphonic preset UUID.
+            concurrency: Maximum number of productions in flight at once.
+
+        Returns:
+            Paths to enhanced audio files, in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def enhance_one(audio_path: Path, output_path: Path) -> Path:
+            async with semaphore:
+                return await self.enhance_audio(audio_path, output_path, preset_uuid)
+
+        return await asyncio.gather(
+            *(enhance_one(audio_path, output_path) for audio_path, output_path in files)
+        )
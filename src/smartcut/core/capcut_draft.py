@@ -1,26 +1,320 @@
 """CapCut draft project generator."""
 
-import json
+import os
+import secrets
+import threading
 import time
-import uuid
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
+
+import orjson
 
 from smartcut.config import MICROSECONDS_PER_SECOND
 
+JSON_WRITE_BUFFER_SIZE = 1 << 20
+
+
+_UUID_POOL_SIZE = 256  # UUIDs worth of random bytes fetched per os.urandom call
+_uuid_pool = b""
+_uuid_pool_pos = 0
+_uuid_pool_lock = threading.Lock()
+
 
 def generate_uuid() -> str:
-    """Generate a UUID string for CapCut objects."""
-    return str(uuid.uuid4()).upper()
+    """Generate an uppercase random (version 4) UUID string for CapCut objects."""
+    global _uuid_pool, _uuid_pool_pos
 
+    with _uuid_pool_lock:
+        if _uuid_pool_pos >= len(_uuid_pool):
+            _uuid_pool = os.urandom(16 * _UUID_POOL_SIZE)
+            _uuid_pool_pos = 0
+        raw = bytearray(_uuid_pool[_uuid_pool_pos:_uuid_pool_pos + 16])
+        _uuid_pool_pos += 16
 
-def generate_id() -> str:
-    """Generate a numeric-like ID string."""
-    return str(uuid.uuid4().int)[:19]
+    raw[6] = (raw[6] & 0x0F) | 0x40  # Version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex().upper()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
-@dataclass
+def generate_id() -> str:
+    """Generate a 19-digit numeric-like ID string."""
+    return str(10**18 + secrets.randbelow(9 * 10**18))
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """
+    Serialize data with orjson and write it to path atomically.
+
+    Writes to a temporary file next to path and renames it into place, so
+    CapCut never sees a half-written file if the process dies mid-save.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb", buffering=JSON_WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Constant JSON fragments shared by every generated object. The builders below
+# reference these instead of rebuilding them; they are only ever serialized,
+# never mutated.
+
+_SUB_TIME_RANGE = {"duration": -1, "start": -1}
+
+_FLIP = {"horizontal": False, "vertical": False}
+_SCALE = {"x": 1.0, "y": 1.0}
+
+_VIDEO_CLIP = {
+    "alpha": 1.0,
+    "flip": _FLIP,
+    "rotation": 0.0,
+    "scale": _SCALE,
+    "transform": {"x": 0.0, "y": 0.0},
+}
+
+# Segment fields common to video and text segments. Keys set per segment are
+# listed with None so they keep their position in the output.
+_SEGMENT_TEMPLATE = {
+    "id": None,
+    "material_id": None,
+    "target_timerange": None,
+    "source_timerange": None,
+    "cartoon": False,
+    "clip": None,
+    "common_keyframes": [],
+    "enable_adjust": None,
+    "enable_color_correct_adjust": False,
+    "enable_color_curves": True,
+    "enable_color_match_adjust": False,
+    "enable_color_wheels": True,
+    "enable_hsl": False,
+    "enable_lut": False,
+    "extra_material_refs": [],
+    "group_id": "",
+    "hdr_settings": {"intensity": 1.0, "mode": 1, "nits": 1000},
+    "intensifies_audio": False,
+    "is_placeholder": False,
+    "is_tone_modify": False,
+    "keyframe_refs": [],
+    "last_nonzero_volume": 1.0,
+    "render_index": None,
+    "responsive_layout": {
+        "enable": False,
+        "horizontal_pos_layout": 0,
+        "size_layout": 0,
+        "target_follow": "",
+        "vertical_pos_layout": 0,
+    },
+    "reverse": False,
+    "speed": 1.0,
+    "template_id": "",
+    "template_scene": "default",
+    "track_attribute": 0,
+    "track_render_index": 0,
+    "uniform_scale": {"on": True, "value": 1.0},
+    "visible": True,
+    "volume": 1.0,
+}
+_VIDEO_SEGMENT_TEMPLATE = {
+    **_SEGMENT_TEMPLATE,
+    "clip": _VIDEO_CLIP,
+    "enable_adjust": True,
+    "render_index": 0,
+}
+_TEXT_SEGMENT_TEMPLATE = {
+    **_SEGMENT_TEMPLATE,
+    "enable_adjust": False,
+    "render_index": 11000,
+}
+
+_TEXT_MATERIAL_TEMPLATE = {
+    "id": None,
+    "type": "text",
+    "add_type": 0,
+    "alignment": 1,
+    "background_alpha": None,
+    "background_color": None,
+    "background_height": 0.14,
+    "background_horizontal_offset": 0.0,
+    "background_round_radius": 0.0,
+    "background_style": None,
+    "background_vertical_offset": 0.0,
+    "background_width": 0.14,
+    "bold_width": None,
+    "border_alpha": 1.0,
+    "border_color": "",
+    "border_width": 0.08,
+    "caption_template_info": {
+        "category_id": "",
+        "category_name": "",
+        "effect_id": "",
+        "is_new": False,
+        "path": "",
+        "request_id": "",
+        "resource_id": "",
+        "resource_name": "",
+        "source_platform": 0,
+    },
+    "check_flag": 7,
+    "combo_info": {"text_templates": []},
+    "content": None,
+    "fixed_height": -1.0,
+    "fixed_width": -1.0,
+    "font_category_id": "",
+    "font_category_name": "",
+    "font_id": "",
+    "font_name": "",
+    "font_path": None,
+    "font_resource_id": "",
+    "font_size": None,
+    "font_source_platform": 0,
+    "font_team_id": "",
+    "font_title": "",
+    "font_url": "",
+    "fonts": [],
+    "force_apply_line_max_width": False,
+    "global_alpha": 1.0,
+    "group_id": "",
+    "has_shadow": False,
+    "initial_scale": 1.0,
+    "inner_padding": -1.0,
+    "is_rich_text": False,
+    "italic_degree": 0,
+    "ktv_color": "",
+    "language": "",
+    "layer_weight": 1,
+    "letter_spacing": 0.0,
+    "line_feed": 1,
+    "line_max_width": 0.82,
+    "line_spacing": 0.02,
+    "multi_language_current": "none",
+    "name": "",
+    "original_size": [],
+    "preset_category": "",
+    "preset_category_id": "",
+    "preset_has_set_alignment": False,
+    "preset_id": "",
+    "preset_index": 0,
+    "preset_name": "",
+    "recognize_task_id": "",
+    "recognize_type": 0,
+    "relevance_segment": [],
+    "shadow_alpha": 0.9,
+    "shadow_angle": -45.0,
+    "shadow_color": "",
+    "shadow_distance": 5.0,
+    "shadow_point": {"x": 0.6363961030678928, "y": -0.6363961030678928},
+    "shadow_smoothing": 0.45,
+    "shape_clip_x": False,
+    "shape_clip_y": False,
+    "source_from": "",
+    "style_name": "",
+    "sub_type": 0,
+    "subtitle_keywords": None,
+    "text_alpha": 1.0,
+    "text_color": None,
+    "text_curve": None,
+    "text_preset_resource_id": "",
+    "text_size": None,
+    "text_to_audio_ids": [],
+    "tts_auto_update": False,
+    "typesetting": 0,
+    "underline": False,
+    "underline_offset": 0.22,
+    "underline_width": 0.05,
+    "use_effect_default_color": True,
+    "words": {"end_time": [], "start_time": [], "text": []},
+}
+
+_TEXT_FILL = {
+    "alpha": 1.0,
+    "content": {"render_type": "solid", "solid": {"color": [1.0, 1.0, 1.0]}},
+}
+
+_DRAFT_CONFIG = {"adjust_max_index": 1, "attachment_info": [], "combination_max_index": 1, "export_range": None, "extract_audio_last_index": 1, "lyrics_recognition_id": "", "lyrics_sync": True, "lyrics_taskinfo": [], "maintrack_adsorb": True, "material_save_mode": 0, "multi_language_current": "none", "multi_language_list": [], "multi_language_main": "none", "multi_language_mode": "none", "original_sound_last_index": 1, "record_audio_last_index": 1, "sticker_max_index": 1, "subtitle_keywords_config": None, "subtitle_recognition_id": "", "subtitle_sync": True, "subtitle_taskinfo": [], "system_font_list": [], "text_animation_last_index": 1, "text_to_audio_ids": [], "video_mute": False, "zoom_info_params": None}
+_DRAFT_KEYFRAMES = {"adjusts": [], "audios": [], "effects": [], "filters": [], "handwrites": [], "stickers": [], "texts": [], "videos": []}
+_DRAFT_PLATFORM = {"app_id": 0, "app_source": "", "app_version": "", "device_id": "", "hard_disk_id": "", "mac_address": "", "os": "mac", "os_version": ""}
+
+# All material categories of a draft; "texts" and "videos" are filled per draft
+_EMPTY_MATERIALS = {
+    name: []
+    for name in (
+        "adjusts", "audio_balances", "audio_effects", "audio_fades", "audio_track_indexes",
+        "audios", "beats", "canvases", "chromas", "color_curves", "digital_humans", "drafts",
+        "effects", "flowers", "green_screens", "handwrites", "hsl", "images", "log_color_wheels",
+        "loudnesses", "manual_deformations", "masks", "material_animations", "material_colors",
+        "multi_language_refs", "placeholders", "plugin_effects", "primary_color_wheels",
+        "realtime_denoises", "shapes", "smart_crops", "smart_relights", "sound_channel_mappings",
+        "speeds", "stickers", "tail_leaders", "text_templates", "texts", "time_marks",
+        "transitions", "video_effects", "video_trackings", "videos", "vocal_beautifys",
+        "vocal_separations",
+    )
+}
+
+
+# Placeholders swapped for real values in pre-serialized text content blobs
+_LEN_SLOT = "__smartcut_text_len__"
+_TEXT_SLOT = "__smartcut_text__"
+
+
+@lru_cache(maxsize=64)
+def _text_content_parts(style: "TextStyle") -> tuple[str, str, str]:
+    """
+    Serialize the styled text "content" blob once per style.
+
+    Returns:
+        (head, middle, tail) so that head + len(text) + middle + JSON(text) + tail
+        is the full blob.
+    """
+    content = {
+        "styles": [
+            {
+                "fill": _TEXT_FILL,
+                "font": {
+                    "id": "",
+                    "path": style.font_path,
+                },
+                "range": [0, _LEN_SLOT],
+                "size": style.font_size,
+            }
+        ],
+        "text": _TEXT_SLOT,
+    }
+    blob = orjson.dumps(content).decode()
+    head, rest = blob.split(f'"{_LEN_SLOT}"')
+    middle, tail = rest.split(f'"{_TEXT_SLOT}"')
+    return head, middle, tail
+
+
+def _build_text_content_json(text: str, style: "TextStyle") -> str:
+    """Serialize the styled "content" blob embedded in a text material."""
+    head, middle, tail = _text_content_parts(style)
+    return f"{head}{len(text)}{middle}{orjson.dumps(text).decode()}{tail}"
+
+
+@lru_cache(maxsize=64)
+def _text_material_style_template(style: "TextStyle") -> dict:
+    """Text material JSON with all style-dependent fields filled in (shared, never mutated)."""
+    return {
+        **_TEXT_MATERIAL_TEMPLATE,
+        "background_alpha": style.background_alpha,
+        "background_color": style.background_color or "",
+        "background_style": 0 if not style.background_color else 1,
+        "bold_width": 0.0 if not style.bold else 1.0,
+        "font_path": style.font_path,
+        "font_size": style.font_size,
+        "text_color": style.font_color,
+        "text_size": style.font_size,
+    }
+
+
+@dataclass(slots=True, frozen=True)
 class TextStyle:
     """Style configuration for text/subtitle segments."""
 
@@ -33,7 +327,7 @@ class TextStyle:
     font_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoSegment:
     """Video segment on timeline."""
 
@@ -44,7 +338,7 @@ class VideoSegment:
     duration_us: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TextSegment:
     """Text segment on timeline."""
 
@@ -54,7 +348,7 @@ class TextSegment:
     duration_us: int
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoMaterial:
     """Video material definition."""
 
@@ -63,15 +357,17 @@ class VideoMaterial:
     duration_us: int
     width: int
     height: int
+    material_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TextMaterial:
     """Text material definition."""
 
     id: str
     text: str
     style: TextStyle
+    content_json: str = field(default="", repr=False)  # Serialized "content" blob, set on insert
 
 
 class CapCutDraft:
@@ -92,6 +388,8 @@ class CapCutDraft:
         self.text_materials: list[TextMaterial] = []
         self.video_segments: list[VideoSegment] = []
         self.text_segments: list[TextSegment] = []
+        # Timeline end of all segments so far, kept up to date by add_*_segment
+        self._timeline_end_us = 0
 
     def add_video_material(
         self,
@@ -102,13 +400,15 @@ class CapCutDraft:
     ) -> str:
         """Add a video material and return its ID."""
         material_id = generate_uuid()
+        abs_path = os.fspath(file_path) if file_path.is_absolute() else os.path.abspath(file_path)
         self.video_materials.append(
             VideoMaterial(
                 id=material_id,
-                file_path=str(file_path.absolute()),
+                file_path=abs_path,
                 duration_us=duration_us,
                 width=width,
                 height=height,
+                material_name=os.path.basename(abs_path),
             )
         )
         return material_id
@@ -131,16 +431,52 @@ class CapCutDraft:
                 duration_us=duration_us,
             )
         )
+        self._timeline_end_us = max(self._timeline_end_us, timeline_start_us + duration_us)
         return segment_id
 
+    def add_video_segments(
+        self,
+        material_id: str,
+        segments: Iterable[tuple[int, int, int]],
+    ) -> list[str]:
+        """
+        Add many video segments of one material to the timeline at once.
+
+        Args:
+            material_id: Video material ID.
+            segments: (timeline_start_us, source_start_us, duration_us) tuples.
+
+        Returns:
+            IDs of the added segments, in order.
+        """
+        new_segments = [
+            VideoSegment(
+                id=generate_uuid(),
+                material_id=material_id,
+                timeline_start_us=timeline_start_us,
+                source_start_us=source_start_us,
+                duration_us=duration_us,
+            )
+            for timeline_start_us, source_start_us, duration_us in segments
+        ]
+        self.video_segments.extend(new_segments)
+        if new_segments:
+            self._timeline_end_us = max(
+                self._timeline_end_us,
+                max(seg.timeline_start_us + seg.duration_us for seg in new_segments),
+            )
+        return [seg.id for seg in new_segments]
+
     def add_text_material(self, text: str, style: Optional[TextStyle] = None) -> str:
         """Add a text material and return its ID."""
         material_id = generate_uuid()
+        style = style or TextStyle()
         self.text_materials.append(
             TextMaterial(
                 id=material_id,
                 text=text,
-                style=style or TextStyle(),
+                style=style,
+                content_json=_build_text_content_json(text, style),
             )
         )
         return material_id
@@ -161,21 +497,16 @@ class CapCutDraft:
                 duration_us=duration_us,
             )
         )
+        self._timeline_end_us = max(self._timeline_end_us, timeline_start_us + duration_us)
         return segment_id
 
     def _calculate_total_duration(self) -> int:
         """Calculate total timeline duration in microseconds."""
-        max_end = 0
-        for seg in self.video_segments:
-            end = seg.timeline_start_us + seg.duration_us
-            max_end = max(max_end, end)
-        for seg in self.text_segments:
-            end = seg.timeline_start_us + seg.duration_us
-            max_end = max(max_end, end)
-        return max_end
-
-    def _build_video_material_json(self, material: VideoMaterial) -> dict:
-        """Build JSON for a video material."""
+        return self._timeline_end_us
+
+    def _build_video_material_json(self, material: VideoMaterial, now_ms: int) -> dict:
+        """Build JSON for a video material (now_ms: current time in milliseconds)."""
+        now = now_ms // 1000
         return {
             "id": material.id,
             "type": "video",
@@ -185,28 +516,26 @@ class CapCutDraft:
             "height": material.height,
             "category_id": "",
             "category_name": "local",
-            "create_time": int(time.time()),
+            "create_time": now,
             "extra_info": "",
-            "import_time": int(time.time()),
-            "import_time_ms": int(time.time() * 1000),
+            "import_time": now,
+            "import_time_ms": now_ms,
             "local_material_id": generate_id(),
             "material_id": material.id,
-            "material_name": Path(material.file_path).name,
+            "material_name": material.material_name or os.path.basename(material.file_path),
             "media_path": "",
             "metetype": "video",
             "roughcut_time_range": {
                 "duration": material.duration_us,
                 "start": 0,
             },
-            "sub_time_range": {
-                "duration": -1,
-                "start": -1,
-            },
+            "sub_time_range": _SUB_TIME_RANGE,
         }
 
     def _build_video_segment_json(self, segment: VideoSegment) -> dict:
         """Build JSON for a video segment."""
         return {
+            **_VIDEO_SEGMENT_TEMPLATE,
             "id": segment.id,
             "material_id": segment.material_id,
             "target_timerange": {
@@ -217,182 +546,28 @@ class CapCutDraft:
                 "start": segment.source_start_us,
                 "duration": segment.duration_us,
             },
-            "cartoon": False,
-            "clip": {
-                "alpha": 1.0,
-                "flip": {"horizontal": False, "vertical": False},
-                "rotation": 0.0,
-                "scale": {"x": 1.0, "y": 1.0},
-                "transform": {"x": 0.0, "y": 0.0},
-            },
-            "common_keyframes": [],
-            "enable_adjust": True,
-            "enable_color_correct_adjust": False,
-            "enable_color_curves": True,
-            "enable_color_match_adjust": False,
-            "enable_color_wheels": True,
-            "enable_hsl": False,
-            "enable_lut": False,
-            "extra_material_refs": [],
-            "group_id": "",
-            "hdr_settings": {"intensity": 1.0, "mode": 1, "nits": 1000},
-            "intensifies_audio": False,
-            "is_placeholder": False,
-            "is_tone_modify": False,
-            "keyframe_refs": [],
-            "last_nonzero_volume": 1.0,
-            "render_index": 0,
-            "responsive_layout": {
-                "enable": False,
-                "horizontal_pos_layout": 0,
-                "size_layout": 0,
-                "target_follow": "",
-                "vertical_pos_layout": 0,
-            },
-            "reverse": False,
-            "speed": 1.0,
-            "template_id": "",
-            "template_scene": "default",
-            "track_attribute": 0,
-            "track_render_index": 0,
-            "uniform_scale": {"on": True, "value": 1.0},
-            "visible": True,
-            "volume": 1.0,
         }
 
     def _build_text_material_json(self, material: TextMaterial) -> dict:
         """Build JSON for a text material."""
-        style = material.style
-
-        # Build content with potential styling
-        content = {
-            "styles": [
-                {
-                    "fill": {
-                        "alpha": 1.0,
-                        "content": {"render_type": "solid", "solid": {"color": [1.0, 1.0, 1.0]}},
-                    },
-                    "font": {
-                        "id": "",
-                        "path": style.font_path,
-                    },
-                    "range": [0, len(material.text)],
-                    "size": style.font_size,
-                }
-            ],
-            "text": material.text,
-        }
-
         return {
+            **_text_material_style_template(material.style),
             "id": material.id,
-            "type": "text",
-            "add_type": 0,
-            "alignment": 1,
-            "background_alpha": style.background_alpha,
-            "background_color": style.background_color or "",
-            "background_height": 0.14,
-            "background_horizontal_offset": 0.0,
-            "background_round_radius": 0.0,
-            "background_style": 0 if not style.background_color else 1,
-            "background_vertical_offset": 0.0,
-            "background_width": 0.14,
-            "bold_width": 0.0 if not style.bold else 1.0,
-            "border_alpha": 1.0,
-            "border_color": "",
-            "border_width": 0.08,
-            "caption_template_info": {
-                "category_id": "",
-                "category_name": "",
-                "effect_id": "",
-                "is_new": False,
-                "path": "",
-                "request_id": "",
-                "resource_id": "",
-                "resource_name": "",
-                "source_platform": 0,
-            },
-            "check_flag": 7,
-            "combo_info": {"text_templates": []},
-            "content": json.dumps(content),
-            "fixed_height": -1.0,
-            "fixed_width": -1.0,
-            "font_category_id": "",
-            "font_category_name": "",
-            "font_id": "",
-            "font_name": "",
-            "font_path": style.font_path,
-            "font_resource_id": "",
-            "font_size": style.font_size,
-            "font_source_platform": 0,
-            "font_team_id": "",
-            "font_title": "",
-            "font_url": "",
-            "fonts": [],
-            "force_apply_line_max_width": False,
-            "global_alpha": 1.0,
-            "group_id": "",
-            "has_shadow": False,
-            "initial_scale": 1.0,
-            "inner_padding": -1.0,
-            "is_rich_text": False,
-            "italic_degree": 0,
-            "ktv_color": "",
-            "language": "",
-            "layer_weight": 1,
-            "letter_spacing": 0.0,
-            "line_feed": 1,
-            "line_max_width": 0.82,
-            "line_spacing": 0.02,
-            "multi_language_current": "none",
-            "name": "",
-            "original_size": [],
-            "preset_category": "",
-            "preset_category_id": "",
-            "preset_has_set_alignment": False,
-            "preset_id": "",
-            "preset_index": 0,
-            "preset_name": "",
-            "recognize_task_id": "",
-            "recognize_type": 0,
-            "relevance_segment": [],
-            "shadow_alpha": 0.9,
-            "shadow_angle": -45.0,
-            "shadow_color": "",
-            "shadow_distance": 5.0,
-            "shadow_point": {"x": 0.6363961030678928, "y": -0.6363961030678928},
-            "shadow_smoothing": 0.45,
-            "shape_clip_x": False,
-            "shape_clip_y": False,
-            "source_from": "",
-            "style_name": "",
-            "sub_type": 0,
-            "subtitle_keywords": None,
-            "text_alpha": 1.0,
-            "text_color": style.font_color,
-            "text_curve": None,
-            "text_preset_resource_id": "",
-            "text_size": style.font_size,
-            "text_to_audio_ids": [],
-            "tts_auto_update": False,
-            "type": "text",
-            "typesetting": 0,
-            "underline": False,
-            "underline_offset": 0.22,
-            "underline_width": 0.05,
-            "use_effect_default_color": True,
-            "words": {"end_time": [], "start_time": [], "text": []},
+            "content": material.content_json or _build_text_content_json(material.text, material.style),
         }
 
-    def _build_text_segment_json(self, segment: TextSegment) -> dict:
+    def _build_text_segment_json(
+        self,
+        segment: TextSegment,
+        text_materials_by_id: dict[str, TextMaterial],
+    ) -> dict:
         """Build JSON for a text segment."""
         # Find the corresponding material to get position
-        material = next(
-            (m for m in self.text_materials if m.id == segment.material_id),
-            None
-        )
+        material = text_materials_by_id.get(segment.material_id)
         position_y = material.style.position_y if material else 0.8
 
         return {
+            **_TEXT_SEGMENT_TEMPLATE,
             "id": segment.id,
             "material_id": segment.material_id,
             "target_timerange": {
@@ -403,56 +578,24 @@ class CapCutDraft:
                 "start": 0,
                 "duration": segment.duration_us,
             },
-            "cartoon": False,
             "clip": {
                 "alpha": 1.0,
-                "flip": {"horizontal": False, "vertical": False},
+                "flip": _FLIP,
                 "rotation": 0.0,
-                "scale": {"x": 1.0, "y": 1.0},
+                "scale": _SCALE,
                 "transform": {"x": 0.0, "y": position_y - 0.5},  # Center-relative
             },
-            "common_keyframes": [],
-            "enable_adjust": False,
-            "enable_color_correct_adjust": False,
-            "enable_color_curves": True,
-            "enable_color_match_adjust": False,
-            "enable_color_wheels": True,
-            "enable_hsl": False,
-            "enable_lut": False,
-            "extra_material_refs": [],
-            "group_id": "",
-            "hdr_settings": {"intensity": 1.0, "mode": 1, "nits": 1000},
-            "intensifies_audio": False,
-            "is_placeholder": False,
-            "is_tone_modify": False,
-            "keyframe_refs": [],
-            "last_nonzero_volume": 1.0,
-            "render_index": 11000,
-            "responsive_layout": {
-                "enable": False,
-                "horizontal_pos_layout": 0,
-                "size_layout": 0,
-                "target_follow": "",
-                "vertical_pos_layout": 0,
-            },
-            "reverse": False,
-            "speed": 1.0,
-            "template_id": "",
-            "template_scene": "default",
-            "track_attribute": 0,
-            "track_render_index": 0,
-            "uniform_scale": {"on": True, "value": 1.0},
-            "visible": True,
-            "volume": 1.0,
         }
 
     def build_draft_content(self) -> dict:
         """Build the complete draft_content.json structure."""
         total_duration = self._calculate_total_duration()
+        now_ms = int(time.time() * 1000)
+        now = now_ms // 1000
 
         # Build materials
         video_materials_json = [
-            self._build_video_material_json(m) for m in self.video_materials
+            self._build_video_material_json(m, now_ms) for m in self.video_materials
         ]
         text_materials_json = [
             self._build_text_material_json(m) for m in self.text_materials
@@ -472,13 +615,16 @@ class CapCutDraft:
         tracks = [video_track]
 
         if self.text_segments:
+            text_materials_by_id = {m.id: m for m in self.text_materials}
             text_track = {
                 "attribute": 0,
                 "flag": 0,
                 "id": generate_uuid(),
                 "is_default_name": True,
                 "name": "",
-                "segments": [self._build_text_segment_json(s) for s in self.text_segments],
+                "segments": [
+                    self._build_text_segment_json(s, text_materials_by_id) for s in self.text_segments
+                ],
                 "type": "text",
             }
             tracks.append(text_track)
@@ -490,9 +636,9 @@ class CapCutDraft:
                 "width": self.canvas_width,
             },
             "color_space": 0,
-            "config": {"adjust_max_index": 1, "attachment_info": [], "combination_max_index": 1, "export_range": None, "extract_audio_last_index": 1, "lyrics_recognition_id": "", "lyrics_sync": True, "lyrics_taskinfo": [], "maintrack_adsorb": True, "material_save_mode": 0, "multi_language_current": "none", "multi_language_list": [], "multi_language_main": "none", "multi_language_mode": "none", "original_sound_last_index": 1, "record_audio_last_index": 1, "sticker_max_index": 1, "subtitle_keywords_config": None, "subtitle_recognition_id": "", "subtitle_sync": True, "subtitle_taskinfo": [], "system_font_list": [], "text_animation_last_index": 1, "text_to_audio_ids": [], "video_mute": False, "zoom_info_params": None},
+            "config": _DRAFT_CONFIG,
             "cover": "",
-            "create_time": int(time.time()),
+            "create_time": now,
             "duration": total_duration,
             "extra_info": "",
             "fps": 30.0,
@@ -500,66 +646,24 @@ class CapCutDraft:
             "group_container": None,
             "id": self.project_id,
             "keyframe_graph_list": [],
-            "keyframes": {"adjusts": [], "audios": [], "effects": [], "filters": [], "handwrites": [], "stickers": [], "texts": [], "videos": []},
-            "last_modified_platform": {"app_id": 0, "app_source": "", "app_version": "", "device_id": "", "hard_disk_id": "", "mac_address": "", "os": "mac", "os_version": ""},
+            "keyframes": _DRAFT_KEYFRAMES,
+            "last_modified_platform": _DRAFT_PLATFORM,
             "materials": {
-                "adjusts": [],
-                "audio_balances": [],
-                "audio_effects": [],
-                "audio_fades": [],
-                "audio_track_indexes": [],
-                "audios": [],
-                "beats": [],
-                "canvases": [],
-                "chromas": [],
-                "color_curves": [],
-                "digital_humans": [],
-                "drafts": [],
-                "effects": [],
-                "flowers": [],
-                "green_screens": [],
-                "handwrites": [],
-                "hsl": [],
-                "images": [],
-                "log_color_wheels": [],
-                "loudnesses": [],
-                "manual_deformations": [],
-                "masks": [],
-                "material_animations": [],
-                "material_colors": [],
-                "multi_language_refs": [],
-                "placeholders": [],
-                "plugin_effects": [],
-                "primary_color_wheels": [],
-                "realtime_denoises": [],
-                "shapes": [],
-                "smart_crops": [],
-                "smart_relights": [],
-                "sound_channel_mappings": [],
-                "speeds": [],
-                "stickers": [],
-                "tail_leaders": [],
-                "text_templates": [],
+                **_EMPTY_MATERIALS,
                 "texts": text_materials_json,
-                "time_marks": [],
-                "transitions": [],
-                "video_effects": [],
-                "video_trackings": [],
                 "videos": video_materials_json,
-                "vocal_beautifys": [],
-                "vocal_separations": [],
             },
             "mutable_config": None,
             "name": self.project_name,
             "new_version": "113.0.0",
-            "platform": {"app_id": 0, "app_source": "", "app_version": "", "device_id": "", "hard_disk_id": "", "mac_address": "", "os": "mac", "os_version": ""},
+            "platform": _DRAFT_PLATFORM,
             "relationships": [],
             "render_index_track_mode_on": False,
             "retouch_cover": None,
             "source": "default",
             "static_cover_image_path": "",
             "tracks": tracks,
-            "update_time": int(time.time()),
+            "update_time": now,
             "version": 360000,
         }
 
@@ -614,15 +718,12 @@ class CapCutDraft:
         project_folder.mkdir(parents=True, exist_ok=True)
 
         # Save draft_content.json
-        draft_content = self.build_draft_content()
-        draft_content_path = project_folder / "draft_content.json"
-        with open(draft_content_path, "w", encoding="utf-8") as f:
-            json.dump(draft_content, f, ensure_ascii=False, indent=2)
+        _write_json(project_folder / "draft_content.json", self.build_draft_content())
 
         # Save draft_meta_info.json
-        draft_meta = self.build_draft_meta_info(str(project_folder.absolute()))
-        draft_meta_path = project_folder / "draft_meta_info.json"
-        with open(draft_meta_path, "w", encoding="utf-8") as f:
-            json.dump(draft_meta, f, ensure_ascii=False, indent=2)
+        _write_json(
+            project_folder / "draft_meta_info.json",
+            self.build_draft_meta_info(str(project_folder.absolute())),
+        )
 
         return project_folder
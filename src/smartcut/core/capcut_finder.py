@@ -1,51 +1,68 @@
 """CapCut project discovery and listing."""
 
-import json
+import os
 import platform
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from smartcut.core.models import ProjectInfo
 
+# draft_info.json path -> (st_mtime_ns, st_size, video count); avoids re-parsing
+# unchanged (often multi-MB) content files on every listing
+_video_count_cache: dict[str, tuple[int, int, int]] = {}
 
-def get_capcut_drafts_dir() -> Optional[Path]:
-    """
-    Auto-detect CapCut drafts directory for current OS.
 
-    Returns:
-        Path to drafts directory or None if not found.
-    """
+@lru_cache(maxsize=1)
+def _drafts_dir_candidates() -> tuple[Path, ...]:
+    """Possible CapCut drafts locations for current OS, in priority order."""
     system = platform.system()
+    home = Path.home()
 
     if system == "Darwin":  # macOS
-        path = Path.home() / "Movies" / "CapCut" / "User Data" / "Projects" / "com.lveditor.draft"
+        return (home / "Movies" / "CapCut" / "User Data" / "Projects" / "com.lveditor.draft",)
     elif system == "Windows":
-        local_app_data = Path.home() / "AppData" / "Local"
-        path = local_app_data / "CapCut" / "User Data" / "Projects" / "com.lveditor.draft"
+        local_app_data = home / "AppData" / "Local"
+        return (local_app_data / "CapCut" / "User Data" / "Projects" / "com.lveditor.draft",)
     elif system == "Linux":
         # Try common Linux locations
-        possible_paths = [
-            Path.home() / ".capcut" / "drafts",
-            Path.home() / ".local" / "share" / "CapCut" / "drafts",
-            Path.home() / "CapCut" / "drafts",
-        ]
-        for p in possible_paths:
-            if p.exists():
-                return p
-        return None
+        return (
+            home / ".capcut" / "drafts",
+            home / ".local" / "share" / "CapCut" / "drafts",
+            home / "CapCut" / "drafts",
+        )
     else:
-        return None
+        return ()
+
+
+def get_capcut_drafts_dir() -> Optional[Path]:
+    """
+    Auto-detect CapCut drafts directory for current OS.
 
-    return path if path.exists() else None
+    Returns:
+        Path to drafts directory or None if not found.
+    """
+    for path in _drafts_dir_candidates():
+        if path.exists():
+            return path
+    return None
 
 
-def list_projects(drafts_dir: Optional[Path] = None, require_content: bool = True) -> list[ProjectInfo]:
+def list_projects(
+    drafts_dir: Optional[Path] = None,
+    require_content: bool = True,
+    limit: Optional[int] = None,
+) -> list[ProjectInfo]:
     """
     List all CapCut projects in drafts directory.
 
     Args:
         drafts_dir: Path to drafts directory. Auto-detected if None.
         require_content: If True, only return projects with draft_info.json.
+        limit: If set, only parse the most recently saved projects (by
+            draft_meta_info.json mtime) up to this count.
 
     Returns:
         List of ProjectInfo objects sorted by modification time (newest first).
@@ -58,16 +75,14 @@ def list_projects(drafts_dir: Optional[Path] = None, require_content: bool = Tru
 
     projects = []
 
-    for project_folder in drafts_dir.iterdir():
-        if not project_folder.is_dir():
-            continue
+    # Visit newest first so a limited listing never parses the older tail
+    for project_folder in _project_folders_newest_first(drafts_dir):
+        if limit is not None and len(projects) >= limit:
+            break
 
         meta_file = project_folder / "draft_meta_info.json"
         content_file = project_folder / "draft_info.json"
 
-        if not meta_file.exists():
-            continue
-
         # Skip projects without content file if required
         if require_content and not content_file.exists():
             continue
@@ -102,17 +117,32 @@ def find_project_by_name(
     Returns:
         Path to project folder or None if not found.
     """
-    projects = list_projects(drafts_dir)
+    if drafts_dir is None:
+        drafts_dir = get_capcut_drafts_dir()
+
+    if drafts_dir is None or not drafts_dir.exists():
+        return None
 
     name_lower = name.lower()
 
-    for project in projects:
+    # Only read draft_name from each meta file and stop at the first (newest) match
+    for project_folder in _project_folders_newest_first(drafts_dir):
+        if not (project_folder / "draft_info.json").exists():
+            continue
+
+        try:
+            meta = orjson.loads((project_folder / "draft_meta_info.json").read_bytes())
+        except Exception:
+            # Skip corrupted projects
+            continue
+
+        project_name = meta.get("draft_name", "Untitled")
         if exact_match:
-            if project.name == name:
-                return Path(project.path)
+            if project_name == name:
+                return project_folder
         else:
-            if name_lower in project.name.lower():
-                return Path(project.path)
+            if name_lower in project_name.lower():
+                return project_folder
 
     return None
 
@@ -145,14 +175,30 @@ def find_project_by_id(
     return None
 
 
+def _project_folders_newest_first(drafts_dir: Path) -> list[Path]:
+    """List project folders (those with draft_meta_info.json), newest meta file first."""
+    candidates = []
+    with os.scandir(drafts_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                meta_mtime = os.stat(os.path.join(entry.path, "draft_meta_info.json")).st_mtime_ns
+            except OSError:
+                continue
+            candidates.append((meta_mtime, Path(entry.path)))
+
+    candidates.sort(key=lambda c: c[0], reverse=True)
+    return [folder for _, folder in candidates]
+
+
 def _parse_project_info(
     project_folder: Path,
     meta_file: Path,
     content_file: Path,
 ) -> Optional[ProjectInfo]:
     """Parse project metadata from JSON files."""
-    with open(meta_file, "r", encoding="utf-8") as f:
-        meta = json.load(f)
+    meta = orjson.loads(meta_file.read_bytes())
 
     # Get basic info from meta
     project_id = meta.get("draft_id", project_folder.name)
@@ -164,15 +210,7 @@ def _parse_project_info(
     has_content = content_file.exists()
 
     # Count video materials from content file if exists
-    video_count = 0
-    if has_content:
-        try:
-            with open(content_file, "r", encoding="utf-8") as f:
-                content = json.load(f)
-            videos = content.get("materials", {}).get("videos", [])
-            video_count = len(videos)
-        except Exception:
-            pass
+    video_count = _count_videos(content_file) if has_content else 0
 
     # Format duration
     duration_sec = duration_us / 1_000_000
@@ -190,3 +228,21 @@ def _parse_project_info(
         video_count=video_count,
         has_content=has_content,
     )
+
+
+def _count_videos(content_file: Path) -> int:
+    """Count video materials in draft_info.json, cached by file mtime and size."""
+    try:
+        stat = content_file.stat()
+        key = str(content_file)
+        cached = _video_count_cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        content = orjson.loads(content_file.read_bytes())
+        video_count = len(content.get("materials", {}).get("videos", []))
+    except Exception:
+        return 0
+
+    _video_count_cache[key] = (stat.st_mtime_ns, stat.st_size, video_count)
+    return video_count
@@ -1,13 +1,25 @@
 """CapCut project reader and modifier."""
 
-import json
+import copy
+import os
 import shutil
+import sys
 import time
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
+
+import orjson
 
 from smartcut.config import MICROSECONDS_PER_SECOND
-from smartcut.core.capcut_draft import CapCutDraft, TextStyle, generate_uuid
+from smartcut.core.capcut_draft import (
+    CapCutDraft,
+    TextStyle,
+    _build_text_content_json,
+    _write_json,
+    generate_uuid,
+)
 from smartcut.core.models import (
     CapCutProjectData,
     ExistingTextSegment,
@@ -16,6 +28,117 @@ from smartcut.core.models import (
 )
 
 
+# Shared default for lookups of optional JSON objects; never mutated
+_EMPTY: dict = {}
+
+
+def _new_clip(transform_y: float = 0.0) -> dict:
+    """Fresh segment clip dict; projects are edited in place, so segments must not share nested dicts."""
+    return {
+        "alpha": 1.0,
+        "flip": {"horizontal": False, "vertical": False},
+        "rotation": 0.0,
+        "scale": {"x": 1.0, "y": 1.0},
+        "transform": {"x": 0.0, "y": transform_y},
+    }
+
+
+# Linux FICLONE ioctl request number (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """
+    Copy a file as a copy-on-write clone where the filesystem supports it.
+
+    Uses FICLONE on Linux (Btrfs, XFS) and clonefile(2) on macOS (APFS), so
+    the copy shares data blocks with the source until either is modified.
+    Falls back to shutil.copy2 everywhere else.
+    """
+    if sys.platform == "linux":
+        try:
+            import fcntl
+
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    elif sys.platform == "darwin":
+        libc = _libc()
+        if libc is not None and libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return dst
+
+    return shutil.copy2(src, dst)
+
+
+@lru_cache(maxsize=1)
+def _libc():
+    """Load the C library for clonefile(2); None if unavailable."""
+    try:
+        import ctypes
+        import ctypes.util
+
+        return ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except (OSError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _text_from_content(content_str: str) -> str:
+    """Extract the plain text from a text material's content JSON."""
+    try:
+        return orjson.loads(content_str).get("text", "")
+    except orjson.JSONDecodeError:
+        return ""
+
+
+@lru_cache(maxsize=64)
+def _text_material_template(style: TextStyle) -> dict:
+    """Text material JSON with all style-dependent fields filled in (shared, never mutated)."""
+    return {
+        "id": "",
+        "type": "text",
+        "add_type": 0,
+        "alignment": 1,
+        "background_alpha": style.background_alpha,
+        "background_color": style.background_color or "",
+        "background_style": 0 if not style.background_color else 1,
+        "bold_width": 0.0 if not style.bold else 1.0,
+        "content": "",
+        "font_size": style.font_size,
+        "global_alpha": 1.0,
+        "line_max_width": 0.82,
+        "line_spacing": 0.02,
+        "text_color": style.font_color,
+        "text_size": style.font_size,
+    }
+
+
+class _cached_view:
+    """
+    Like functools.cached_property, but keeps values in the instance's _cache dict.
+
+    Lets CapCutProject use __slots__ and drop all cached views with one clear().
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        cache = obj._cache
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(obj)
+            return value
+
+
 class CapCutProject:
     """
     Represents an existing CapCut project.
@@ -23,6 +146,8 @@ class CapCutProject:
     Can load, modify, and save CapCut draft projects.
     """
 
+    __slots__ = ("project_path", "content_file", "meta_file", "_content", "_meta", "_cache")
+
     def __init__(self, project_path: Path):
         """
         Initialize with project path.
@@ -34,21 +159,27 @@ class CapCutProject:
         self.content_file = project_path / "draft_info.json"
         self.meta_file = project_path / "draft_meta_info.json"
 
-        if not self.content_file.exists():
-            raise FileNotFoundError(f"draft_info.json not found in {project_path}")
-
         self._content: dict = {}
         self._meta: dict = {}
+        self._cache: dict = {}  # Views derived from _content, see _cached_view
         self._load()
 
+    def _invalidate_caches(self) -> None:
+        """Drop cached views of the project content."""
+        self._cache.clear()
+
     def _load(self) -> None:
         """Load project files."""
-        with open(self.content_file, "r", encoding="utf-8") as f:
-            self._content = json.load(f)
+        self._invalidate_caches()
+        try:
+            self._content = orjson.loads(self.content_file.read_bytes())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"draft_info.json not found in {self.project_path}") from None
 
-        if self.meta_file.exists():
-            with open(self.meta_file, "r", encoding="utf-8") as f:
-                self._meta = json.load(f)
+        try:
+            self._meta = orjson.loads(self.meta_file.read_bytes())
+        except FileNotFoundError:
+            pass
 
     @classmethod
     def load(cls, project_path: Path) -> "CapCutProject":
@@ -84,17 +215,18 @@ class CapCutProject:
     @property
     def canvas_width(self) -> int:
         """Get canvas width."""
-        return self._content.get("canvas_config", {}).get("width", 1080)
+        return self._content.get("canvas_config", _EMPTY).get("width", 1080)
 
     @property
     def canvas_height(self) -> int:
         """Get canvas height."""
-        return self._content.get("canvas_config", {}).get("height", 1920)
+        return self._content.get("canvas_config", _EMPTY).get("height", 1920)
 
-    def get_video_materials(self) -> list[ExistingVideoMaterial]:
-        """Get all video materials in project."""
+    @_cached_view
+    def video_materials(self) -> list[ExistingVideoMaterial]:
+        """All video materials in project."""
         materials = []
-        for mat in self._content.get("materials", {}).get("videos", []):
+        for mat in self._content.get("materials", _EMPTY).get("videos", ()):
             materials.append(
                 ExistingVideoMaterial(
                     id=mat.get("id", ""),
@@ -106,88 +238,108 @@ class CapCutProject:
             )
         return materials
 
-    def get_video_segments(self) -> list[ExistingVideoSegment]:
-        """Get all video segments from video track."""
-        segments = []
-        materials_map = {m.id: m for m in self.get_video_materials()}
-
-        for track in self._content.get("tracks", []):
-            if track.get("type") != "video":
-                continue
-
-            for seg in track.get("segments", []):
-                material_id = seg.get("material_id", "")
-                material = materials_map.get(material_id)
-                source_path = material.path if material else ""
-
-                target = seg.get("target_timerange", {})
-                source = seg.get("source_timerange", {})
-
-                timeline_start = target.get("start", 0) / MICROSECONDS_PER_SECOND
-                duration = target.get("duration", 0) / MICROSECONDS_PER_SECOND
-
-                segments.append(
-                    ExistingVideoSegment(
-                        id=seg.get("id", ""),
-                        material_id=material_id,
-                        source_path=source_path,
-                        timeline_start=timeline_start,
-                        timeline_end=timeline_start + duration,
-                        source_start=source.get("start", 0) / MICROSECONDS_PER_SECOND,
-                        source_end=(source.get("start", 0) + source.get("duration", 0)) / MICROSECONDS_PER_SECOND,
-                        duration=duration,
-                    )
-                )
+    @_cached_view
+    def _materials_by_id(self) -> dict[str, ExistingVideoMaterial]:
+        """Video materials keyed by material ID."""
+        return {m.id: m for m in self.video_materials}
 
-        return segments
+    @_cached_view
+    def _material_id_by_path(self) -> dict[str, str]:
+        """Video material IDs keyed by source path (first material wins)."""
+        ids: dict[str, str] = {}
+        for m in self.video_materials:
+            ids.setdefault(m.path, m.id)
+        return ids
 
-    def get_text_segments(self) -> list[ExistingTextSegment]:
-        """Get all text segments from text tracks."""
-        segments = []
+    def get_video_materials(self) -> list[ExistingVideoMaterial]:
+        """Get all video materials in project."""
+        return self.video_materials
+
+    @_cached_view
+    def _track_scan(
+        self,
+    ) -> tuple[Optional[dict], list[ExistingVideoSegment], list[ExistingTextSegment]]:
+        """
+        Walk all tracks once, collecting everything the getters need.
+
+        Returns:
+            Tuple of (first video track, video segments, text segments).
+        """
+        video_track = None
+        video_segments = []
+        text_segments = []
+        materials_map = self._materials_by_id
         text_materials = {
             m.get("id"): m
-            for m in self._content.get("materials", {}).get("texts", [])
+            for m in self._content.get("materials", _EMPTY).get("texts", ())
         }
 
-        for track in self._content.get("tracks", []):
-            if track.get("type") != "text":
-                continue
-
-            for seg in track.get("segments", []):
-                material_id = seg.get("material_id", "")
-                material = text_materials.get(material_id, {})
-
-                # Parse text from content JSON
-                content_str = material.get("content", "{}")
-                try:
-                    content = json.loads(content_str)
-                    text = content.get("text", "")
-                except json.JSONDecodeError:
-                    text = ""
-
-                target = seg.get("target_timerange", {})
-                timeline_start = target.get("start", 0) / MICROSECONDS_PER_SECOND
-                duration = target.get("duration", 0) / MICROSECONDS_PER_SECOND
-
-                segments.append(
-                    ExistingTextSegment(
-                        id=seg.get("id", ""),
-                        material_id=material_id,
-                        text=text,
-                        timeline_start=timeline_start,
-                        timeline_end=timeline_start + duration,
+        for track in self._content.get("tracks", ()):
+            track_type = track.get("type")
+
+            if track_type == "video":
+                if video_track is None:
+                    video_track = track
+
+                for seg in track.get("segments", ()):
+                    material_id = seg.get("material_id", "")
+                    material = materials_map.get(material_id)
+                    source_path = material.path if material else ""
+
+                    target = seg.get("target_timerange", _EMPTY)
+                    source = seg.get("source_timerange", _EMPTY)
+
+                    timeline_start = target.get("start", 0) / MICROSECONDS_PER_SECOND
+                    duration = target.get("duration", 0) / MICROSECONDS_PER_SECOND
+
+                    video_segments.append(
+                        ExistingVideoSegment(
+                            id=seg.get("id", ""),
+                            material_id=material_id,
+                            source_path=source_path,
+                            timeline_start=timeline_start,
+                            timeline_end=timeline_start + duration,
+                            source_start=source.get("start", 0) / MICROSECONDS_PER_SECOND,
+                            source_end=(source.get("start", 0) + source.get("duration", 0)) / MICROSECONDS_PER_SECOND,
+                            duration=duration,
+                        )
                     )
-                )
 
-        return segments
+            elif track_type == "text":
+                for seg in track.get("segments", ()):
+                    material_id = seg.get("material_id", "")
+                    material = text_materials.get(material_id, _EMPTY)
+
+                    # Parse text from content JSON
+                    text = _text_from_content(material.get("content", "{}"))
+
+                    target = seg.get("target_timerange", _EMPTY)
+                    timeline_start = target.get("start", 0) / MICROSECONDS_PER_SECOND
+                    duration = target.get("duration", 0) / MICROSECONDS_PER_SECOND
+
+                    text_segments.append(
+                        ExistingTextSegment(
+                            id=seg.get("id", ""),
+                            material_id=material_id,
+                            text=text,
+                            timeline_start=timeline_start,
+                            timeline_end=timeline_start + duration,
+                        )
+                    )
+
+        return video_track, video_segments, text_segments
+
+    def get_video_segments(self) -> list[ExistingVideoSegment]:
+        """Get all video segments from video track."""
+        return self._track_scan[1]
+
+    def get_text_segments(self) -> list[ExistingTextSegment]:
+        """Get all text segments from text tracks."""
+        return self._track_scan[2]
 
     def get_source_video_paths(self) -> list[Path]:
         """Get unique source video file paths."""
-        paths = set()
-        for material in self.get_video_materials():
-            if material.path:
-                paths.add(Path(material.path))
-        return list(paths)
+        return [Path(path) for path in self._material_id_by_path if path]
 
     def to_project_data(self) -> CapCutProjectData:
         """Convert to CapCutProjectData model."""
@@ -205,23 +357,28 @@ class CapCutProject:
 
     def add_text_track(
         self,
-        subtitles: list[dict],
+        subtitles: Iterable[dict],
         style: Optional[TextStyle] = None,
     ) -> None:
         """
         Add a text track with subtitles.
 
         Args:
-            subtitles: List of dicts with 'start', 'end', 'text' keys (times in seconds).
+            subtitles: Dicts with 'start', 'end', 'text' keys (times in seconds);
+                any iterable, consumed once.
             style: Text style configuration.
         """
-        if not subtitles:
+        # Peek so an empty input leaves the project untouched
+        subtitles = iter(subtitles)
+        first = next(subtitles, None)
+        if first is None:
             return
+        subtitles = chain((first,), subtitles)
 
         style = style or TextStyle()
 
         # Get or create text materials list
-        if "texts" not in self._content.get("materials", {}):
+        if "texts" not in self._content.get("materials", _EMPTY):
             self._content.setdefault("materials", {})["texts"] = []
 
         text_materials = self._content["materials"]["texts"]
@@ -230,31 +387,38 @@ class CapCutProject:
         new_segments = []
         position_toggle = False
 
+        # Bind loop-invariant lookups to locals
+        us_per_sec = MICROSECONDS_PER_SECOND
+        new_uuid = generate_uuid
+        build_material = self._build_text_material
+        build_segment = self._build_text_segment
+        add_material = text_materials.append
+        add_segment = new_segments.append
+        alternate_position = style.position_y == 0.8  # Default bottom
+        fixed_position_y = style.position_y
+
         for sub in subtitles:
-            start_us = int(sub["start"] * MICROSECONDS_PER_SECOND)
-            end_us = int(sub["end"] * MICROSECONDS_PER_SECOND)
+            start_us = int(sub["start"] * us_per_sec)
+            end_us = int(sub["end"] * us_per_sec)
             duration_us = end_us - start_us
-            text = sub["text"]
 
             # Alternate position for dynamic style
-            if style.position_y == 0.8:  # Default bottom
+            if alternate_position:
                 position_y = 0.2 if position_toggle else 0.8
                 position_toggle = not position_toggle
             else:
-                position_y = style.position_y
+                position_y = fixed_position_y
 
             # Create material
-            material_id = generate_uuid()
-            text_material = self._build_text_material(material_id, text, style)
-            text_materials.append(text_material)
+            material_id = new_uuid()
+            add_material(build_material(material_id, sub["text"], style))
 
             # Create segment
-            segment = self._build_text_segment(material_id, start_us, duration_us, position_y)
-            new_segments.append(segment)
+            add_segment(build_segment(material_id, start_us, duration_us, position_y))
 
         # Find or create text track
         text_track = None
-        for track in self._content.get("tracks", []):
+        for track in self._content.get("tracks", ()):
             if track.get("type") == "text":
                 text_track = track
                 break
@@ -273,45 +437,15 @@ class CapCutProject:
 
         # Add segments to track
         text_track["segments"].extend(new_segments)
+        self._invalidate_caches()
 
         # Update duration if needed
         self._update_duration()
 
     def _build_text_material(self, material_id: str, text: str, style: TextStyle) -> dict:
         """Build text material JSON."""
-        content = {
-            "styles": [
-                {
-                    "fill": {
-                        "alpha": 1.0,
-                        "content": {"render_type": "solid", "solid": {"color": [1.0, 1.0, 1.0]}},
-                    },
-                    "font": {"id": "", "path": style.font_path},
-                    "range": [0, len(text)],
-                    "size": style.font_size,
-                }
-            ],
-            "text": text,
-        }
-
-        return {
-            "id": material_id,
-            "type": "text",
-            "add_type": 0,
-            "alignment": 1,
-            "background_alpha": style.background_alpha,
-            "background_color": style.background_color or "",
-            "background_style": 0 if not style.background_color else 1,
-            "bold_width": 0.0 if not style.bold else 1.0,
-            "content": json.dumps(content),
-            "font_size": style.font_size,
-            "global_alpha": 1.0,
-            "line_max_width": 0.82,
-            "line_spacing": 0.02,
-            "text_color": style.font_color,
-            "text_size": style.font_size,
-            "type": "text",
-        }
+        content = _build_text_content_json(text, style)
+        return {**_text_material_template(style), "id": material_id, "content": content}
 
     def _build_text_segment(
         self,
@@ -326,13 +460,7 @@ class CapCutProject:
             "material_id": material_id,
             "target_timerange": {"start": start_us, "duration": duration_us},
             "source_timerange": {"start": 0, "duration": duration_us},
-            "clip": {
-                "alpha": 1.0,
-                "flip": {"horizontal": False, "vertical": False},
-                "rotation": 0.0,
-                "scale": {"x": 1.0, "y": 1.0},
-                "transform": {"x": 0.0, "y": position_y - 0.5},
-            },
+            "clip": _new_clip(position_y - 0.5),
             "render_index": 11000,
             "visible": True,
             "speed": 1.0,
@@ -345,11 +473,12 @@ class CapCutProject:
         Args:
             new_segments: List of dicts with segment data.
         """
-        for track in self._content.get("tracks", []):
+        for track in self._content.get("tracks", ()):
             if track.get("type") == "video":
                 track["segments"] = new_segments
                 break
 
+        self._invalidate_caches()
         self._update_duration()
 
     def apply_cut_plan(self, cut_plan: dict, video_path: Path) -> None:
@@ -362,7 +491,7 @@ class CapCutProject:
             cut_plan: Dict with 'keep_segments' list containing {start, end} in seconds.
             video_path: Source video path (to find matching material).
         """
-        keep_segments = cut_plan.get("keep_segments", [])
+        keep_segments = cut_plan.get("keep_segments", ())
         if not keep_segments:
             return
 
@@ -377,46 +506,46 @@ class CapCutProject:
             return
 
         # Get existing segment as template (for copying default fields)
-        existing_segments = video_track.get("segments", [])
+        existing_segments = video_track.get("segments", ())
         template_segment = existing_segments[0] if existing_segments else {}
 
         # Build new segments from keep_segments
         new_segments = []
         timeline_offset_us = 0
 
+        # Bind loop-invariant lookups to locals
+        us_per_sec = MICROSECONDS_PER_SECOND
+        build_segment = self._build_video_segment
+        add_segment = new_segments.append
+
         for seg in keep_segments:
-            source_start_us = int(seg["start"] * MICROSECONDS_PER_SECOND)
-            source_end_us = int(seg["end"] * MICROSECONDS_PER_SECOND)
+            source_start_us = int(seg["start"] * us_per_sec)
+            source_end_us = int(seg["end"] * us_per_sec)
             duration_us = source_end_us - source_start_us
 
-            new_segment = self._build_video_segment(
-                material_id=material_id,
-                timeline_start_us=timeline_offset_us,
-                source_start_us=source_start_us,
-                duration_us=duration_us,
-                template=template_segment,
+            add_segment(
+                build_segment(
+                    material_id=material_id,
+                    timeline_start_us=timeline_offset_us,
+                    source_start_us=source_start_us,
+                    duration_us=duration_us,
+                    template=template_segment,
+                )
             )
-            new_segments.append(new_segment)
             timeline_offset_us += duration_us
 
         # Replace video track segments
         video_track["segments"] = new_segments
+        self._invalidate_caches()
         self._update_duration()
 
     def _find_video_track(self) -> Optional[dict]:
         """Find the video track in tracks list."""
-        for track in self._content.get("tracks", []):
-            if track.get("type") == "video":
-                return track
-        return None
+        return self._track_scan[0]
 
     def _find_material_id_for_path(self, video_path: Path) -> Optional[str]:
         """Find material_id for a video path."""
-        video_path_str = str(video_path)
-        for mat in self._content.get("materials", {}).get("videos", []):
-            if mat.get("path") == video_path_str:
-                return mat.get("id")
-        return None
+        return self._material_id_by_path.get(str(video_path))
 
     def _build_video_segment(
         self,
@@ -436,21 +565,12 @@ class CapCutProject:
             duration_us: Segment duration (microseconds).
             template: Existing segment to copy default fields from.
         """
-        # Start with template or minimal defaults
+        # Start with template or minimal defaults; deep copy so no nested dict
+        # (clip, timeranges, ...) is shared with the template segment
         if template:
-            segment = template.copy()
+            segment = copy.deepcopy(template)
         else:
-            segment = {
-                "clip": {
-                    "alpha": 1.0,
-                    "flip": {"horizontal": False, "vertical": False},
-                    "rotation": 0.0,
-                    "scale": {"x": 1.0, "y": 1.0},
-                    "transform": {"x": 0.0, "y": 0.0},
-                },
-                "speed": 1.0,
-                "render_index": 0,
-            }
+            segment = {"clip": _new_clip(), "speed": 1.0, "render_index": 0}
 
         # Override with our values
         segment["id"] = generate_uuid()
@@ -462,13 +582,16 @@ class CapCutProject:
 
     def _update_duration(self) -> None:
         """Recalculate and update project duration."""
-        max_end = 0
-
-        for track in self._content.get("tracks", []):
-            for seg in track.get("segments", []):
-                target = seg.get("target_timerange", {})
-                end = target.get("start", 0) + target.get("duration", 0)
-                max_end = max(max_end, end)
+        max_end = max(
+            (
+                target.get("start", 0) + target.get("duration", 0)
+                for track in self._content.get("tracks", ())
+                for target in (
+                    seg.get("target_timerange", _EMPTY) for seg in track.get("segments", ())
+                )
+            ),
+            default=0,
+        )
 
         self._content["duration"] = max_end
         self._meta["tm_duration"] = max_end
@@ -481,12 +604,10 @@ class CapCutProject:
         self._meta["tm_draft_modified"] = current_time
 
         # Write content file
-        with open(self.content_file, "w", encoding="utf-8") as f:
-            json.dump(self._content, f, ensure_ascii=False, indent=2)
+        _write_json(self.content_file, self._content)
 
         # Write meta file
-        with open(self.meta_file, "w", encoding="utf-8") as f:
-            json.dump(self._meta, f, ensure_ascii=False, indent=2)
+        _write_json(self.meta_file, self._meta)
 
     def create_copy(self, new_name: str) -> "CapCutProject":
         """
@@ -513,8 +634,8 @@ class CapCutProject:
             new_path = self.project_path.parent / new_name
             counter += 1
 
-        # Copy project folder
-        shutil.copytree(self.project_path, new_path)
+        # Copy project folder (cloned instead of byte-copied on CoW filesystems)
+        shutil.copytree(self.project_path, new_path, copy_function=_clone_file)
 
         # Load the copy
         copy_project = CapCutProject(new_path)
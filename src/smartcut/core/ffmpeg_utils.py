@@ -1,12 +1,17 @@
 """FFmpeg utility functions for video/audio processing."""
 
-import json
+import os
+import re
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from smartcut.config import TARGET_LUFS
 from smartcut.core.models import LoudnessInfo, MediaInfo
 
@@ -17,36 +22,78 @@ class FFmpegError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
+def ffmpeg_paths() -> tuple[Optional[str], Optional[str]]:
+    """Resolve absolute paths of ffmpeg and ffprobe in PATH (None if missing)."""
+    return shutil.which("ffmpeg"), shutil.which("ffprobe")
+
+
 def check_ffmpeg_installed() -> bool:
     """Check if FFmpeg is installed and available in PATH."""
-    return shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+    ffmpeg, ffprobe = ffmpeg_paths()
+    if ffmpeg and ffprobe:
+        return True
+    # Look again next time; FFmpeg may get installed while the server runs
+    ffmpeg_paths.cache_clear()
+    return False
+
+
+def _ffmpeg() -> str:
+    """Executable to run for ffmpeg, resolved once."""
+    return ffmpeg_paths()[0] or "ffmpeg"
+
+
+def _ffprobe() -> str:
+    """Executable to run for ffprobe, resolved once."""
+    return ffmpeg_paths()[1] or "ffprobe"
+
 
+# ffprobe arguments shared by every get_media_info call; the file path is appended
+_FFPROBE_ARGS = (
+    "-v", "quiet",
+    "-print_format", "json",
+    "-show_format",
+    "-show_streams",
+)
 
-def get_media_info(file_path: Path) -> MediaInfo:
+
+def get_media_info(file_path: Path, st: Optional[os.stat_result] = None) -> MediaInfo:
     """
     Get media file information using ffprobe.
 
+    Results are cached per file path, size and modification time, so probing
+    the same unchanged file again does not spawn another ffprobe.
+
     Args:
         file_path: Path to media file.
+        st: Result of a stat() the caller already made, to skip another one.
 
     Returns:
         MediaInfo object with duration, resolution, etc.
     """
-    cmd = [
-        "ffprobe",
-        "-v", "quiet",
-        "-print_format", "json",
-        "-show_format",
-        "-show_streams",
-        str(file_path),
-    ]
-
+    path_str = str(file_path)
+    if st is None:
+        try:
+            st = file_path.stat()
+        except OSError as e:
+            raise FFmpegError(f"ffprobe failed: {e}")
+    return _probe_media_info(path_str, st.st_mtime_ns, st.st_size).model_copy()
+
+
+@lru_cache(maxsize=256)
+def _probe_media_info(path_str: str, mtime_ns: int, size: int) -> MediaInfo:
+    """Run ffprobe on a file; mtime_ns and size only key the cache."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        data = json.loads(result.stdout)
+        result = subprocess.run(
+            [_ffprobe(), *_FFPROBE_ARGS, path_str],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+        data = orjson.loads(result.stdout)
     except subprocess.CalledProcessError as e:
-        raise FFmpegError(f"ffprobe failed: {e.stderr}")
-    except json.JSONDecodeError as e:
+        raise FFmpegError(f"ffprobe failed: {e.stderr.decode(errors='replace')}")
+    except orjson.JSONDecodeError as e:
         raise FFmpegError(f"Failed to parse ffprobe output: {e}")
 
     # Extract format info
@@ -57,9 +104,14 @@ def get_media_info(file_path: Path) -> MediaInfo:
     # Extract video stream info
     width, height, fps = 1920, 1080, 30.0
     audio_sample_rate = 44100
+    has_video = False
 
     for stream in data.get("streams", []):
         if stream.get("codec_type") == "video":
+            # Embedded cover art in audio files shows up as a video stream
+            if stream.get("disposition", {}).get("attached_pic"):
+                continue
+            has_video = True
             width = stream.get("width", width)
             height = stream.get("height", height)
             # Parse fps from r_frame_rate (e.g., "30/1")
@@ -77,30 +129,53 @@ def get_media_info(file_path: Path) -> MediaInfo:
         fps=fps,
         audio_sample_rate=audio_sample_rate,
         format=file_format,
+        has_video=has_video,
     )
 
 
+def get_media_infos(file_paths: list[Path], max_workers: int = 8) -> list[MediaInfo]:
+    """
+    Get media information for several files, probing them in parallel.
+
+    ffprobe runs as a subprocess, so threads overlap the probes.
+
+    Args:
+        file_paths: Paths to media files.
+        max_workers: Maximum number of concurrent ffprobe processes.
+
+    Returns:
+        MediaInfo objects in input order.
+    """
+    if len(file_paths) <= 1:
+        return [get_media_info(path) for path in file_paths]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        return list(executor.map(get_media_info, file_paths))
+
+
 def extract_audio(
     video_path: Path,
     output_path: Path,
     sample_rate: int = 16000,
+    codec: str = "pcm_s16le",
 ) -> Path:
     """
     Extract audio from video file.
 
     Args:
         video_path: Path to video file.
-        output_path: Path for output audio file (WAV).
+        output_path: Path for output audio file (container from its suffix).
         sample_rate: Audio sample rate (default 16kHz for Whisper).
+        codec: Audio codec (default 16-bit PCM for WAV output).
 
     Returns:
         Path to extracted audio file.
     """
     cmd = [
-        "ffmpeg",
+        _ffmpeg(),
         "-i", str(video_path),
         "-vn",  # No video
-        "-acodec", "pcm_s16le",  # PCM 16-bit
+        "-acodec", codec,
         "-ar", str(sample_rate),  # Sample rate
         "-ac", "1",  # Mono
         "-y",  # Overwrite
@@ -108,13 +183,51 @@ def extract_audio(
     ]
 
     try:
-        subprocess.run(cmd, capture_output=True, check=True)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
     except subprocess.CalledProcessError as e:
         raise FFmpegError(f"Audio extraction failed: {e.stderr.decode()}")
 
     return output_path
 
 
+def split_audio(
+    input_path: Path,
+    output_dir: Path,
+    segment_seconds: float,
+) -> list[Path]:
+    """
+    Split an audio file into consecutive chunks of roughly equal length.
+
+    Uses the segment muxer with stream copy, so chunks keep the input's codec
+    and are produced in a single pass.
+
+    Args:
+        input_path: Input audio file path.
+        output_dir: Directory to write chunks to.
+        segment_seconds: Target chunk length in seconds.
+
+    Returns:
+        Chunk paths in playback order.
+    """
+    pattern = output_dir / f"chunk_%04d{input_path.suffix}"
+    cmd = [
+        _ffmpeg(),
+        "-i", str(input_path),
+        "-f", "segment",
+        "-segment_time", f"{segment_seconds:.3f}",
+        "-reset_timestamps", "1",
+        "-c", "copy",
+        "-y", str(pattern),
+    ]
+
+    try:
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+    except subprocess.CalledProcessError as e:
+        raise FFmpegError(f"Audio splitting failed: {e.stderr.decode()}")
+
+    return sorted(output_dir.glob(f"chunk_*{input_path.suffix}"))
+
+
 def cut_segment(
     input_path: Path,
     output_path: Path,
@@ -138,7 +251,7 @@ def cut_segment(
     duration = end - start
 
     cmd = [
-        "ffmpeg",
+        _ffmpeg(),
         "-ss", str(start),  # Seek before input (faster)
         "-i", str(input_path),
         "-t", str(duration),
@@ -150,13 +263,46 @@ def cut_segment(
     cmd.extend(["-y", str(output_path)])
 
     try:
-        subprocess.run(cmd, capture_output=True, check=True)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
     except subprocess.CalledProcessError as e:
         raise FFmpegError(f"Segment cutting failed: {e.stderr.decode()}")
 
     return output_path
 
 
+def _escape_concat_path(path: Path) -> str:
+    """Quote a path for a concat demuxer list (single quotes escaped)."""
+    return str(path).replace("'", "'\\''")
+
+
+def _run_concat_demuxer(concat_list: str, output_path: Path, error_message: str) -> None:
+    """
+    Run the concat demuxer with stream copy over an in-memory list.
+
+    Args:
+        concat_list: Full text of the concat list file.
+        output_path: Output file path.
+        error_message: Prefix for the FFmpegError raised on failure.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        concat_list_path = Path(temp_dir) / "concat.txt"
+        concat_list_path.write_bytes(concat_list.encode())
+
+        cmd = [
+            _ffmpeg(),
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_list_path),
+            "-c", "copy",
+            "-y", str(output_path),
+        ]
+
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+        except subprocess.CalledProcessError as e:
+            raise FFmpegError(f"{error_message}: {e.stderr.decode()}")
+
+
 def concat_segments(
     segment_paths: list[Path],
     output_path: Path,
@@ -181,82 +327,77 @@ def concat_segments(
         shutil.copy(segment_paths[0], output_path)
         return output_path
 
-    # Create concat list file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        for path in segment_paths:
-            # Escape single quotes in paths
-            escaped_path = str(path).replace("'", "'\\''")
-            f.write(f"file '{escaped_path}'\n")
-        concat_list_path = f.name
+    if not use_concat_filter:
+        # Use concat demuxer (stream copy, fast)
+        concat_list = "".join(f"file '{_escape_concat_path(path)}'\n" for path in segment_paths)
+        _run_concat_demuxer(concat_list, output_path, "Concatenation failed")
+        return output_path
 
-    try:
-        if use_concat_filter:
-            # Use concat filter (re-encodes, handles different formats)
-            inputs = []
-            for path in segment_paths:
-                inputs.extend(["-i", str(path)])
-
-            filter_parts = [f"[{i}:v][{i}:a]" for i in range(len(segment_paths))]
-            filter_complex = "".join(filter_parts) + f"concat=n={len(segment_paths)}:v=1:a=1[outv][outa]"
-
-            cmd = ["ffmpeg"] + inputs + [
-                "-filter_complex", filter_complex,
-                "-map", "[outv]",
-                "-map", "[outa]",
-                "-y", str(output_path),
-            ]
-        else:
-            # Use concat demuxer (stream copy, fast)
-            cmd = [
-                "ffmpeg",
-                "-f", "concat",
-                "-safe", "0",
-                "-i", concat_list_path,
-                "-c", "copy",
-                "-y", str(output_path),
-            ]
-
-        subprocess.run(cmd, capture_output=True, check=True)
+    # Use concat filter (re-encodes, handles different formats)
+    inputs = []
+    for path in segment_paths:
+        inputs.extend(["-i", str(path)])
 
+    filter_parts = [f"[{i}:v][{i}:a]" for i in range(len(segment_paths))]
+    filter_complex = "".join(filter_parts) + f"concat=n={len(segment_paths)}:v=1:a=1[outv][outa]"
+
+    cmd = [_ffmpeg()] + inputs + [
+        "-filter_complex", filter_complex,
+        "-map", "[outv]",
+        "-map", "[outa]",
+        "-y", str(output_path),
+    ]
+
+    try:
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
     except subprocess.CalledProcessError as e:
         raise FFmpegError(f"Concatenation failed: {e.stderr.decode()}")
-    finally:
-        Path(concat_list_path).unlink(missing_ok=True)
 
     return output_path
 
 
-def measure_loudness(file_path: Path) -> LoudnessInfo:
+def cut_and_concat(
+    input_path: Path,
+    ranges: list[tuple[float, float]],
+    output_path: Path,
+) -> Path:
     """
-    Measure audio loudness using FFmpeg loudnorm filter.
+    Cut several ranges from one file and join them in a single FFmpeg run.
+
+    Uses a concat demuxer list that points at the source file with
+    inpoint/outpoint per range, so no intermediate segment files are written
+    and the input is opened by one process instead of one per range.
 
     Args:
-        file_path: Path to audio/video file.
+        input_path: Input file path.
+        ranges: List of (start, end) times in seconds, in output order.
+        output_path: Output file path.
 
     Returns:
-        LoudnessInfo with measured values.
+        Path to output file.
     """
-    cmd = [
-        "ffmpeg",
-        "-i", str(file_path),
-        "-af", "loudnorm=print_format=json",
-        "-f", "null",
-        "-",
-    ]
+    if not ranges:
+        raise FFmpegError("No segments to concatenate")
+
+    entry = f"file '{_escape_concat_path(input_path.absolute())}'\n"
+    concat_list = "".join(f"{entry}inpoint {start}\noutpoint {end}\n" for start, end in ranges)
+    _run_concat_demuxer(concat_list, output_path, "Segment cutting failed")
+
+    return output_path
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        # loudnorm output is in stderr
-        output = result.stderr
 
-        # Find JSON in output
-        json_start = output.rfind("{")
-        json_end = output.rfind("}") + 1
-        if json_start == -1 or json_end == 0:
-            raise FFmpegError("Could not find loudness data in FFmpeg output")
+# The JSON block loudnorm prints to stderr when print_format=json
+_LOUDNORM_JSON_RE = re.compile(rb'\{[^{}]*"input_i"[^{}]*\}')
 
-        loudness_data = json.loads(output[json_start:json_end])
 
+def _parse_loudnorm_stats(stderr: bytes) -> LoudnessInfo:
+    """Extract the input loudness stats loudnorm printed to stderr."""
+    match = _LOUDNORM_JSON_RE.search(stderr)
+    if match is None:
+        raise FFmpegError("Could not find loudness data in FFmpeg output")
+
+    try:
+        loudness_data = orjson.loads(match.group(0))
         return LoudnessInfo(
             input_i=float(loudness_data.get("input_i", -24)),
             input_tp=float(loudness_data.get("input_tp", 0)),
@@ -264,45 +405,78 @@ def measure_loudness(file_path: Path) -> LoudnessInfo:
             input_thresh=float(loudness_data.get("input_thresh", -34)),
             target_offset=float(loudness_data.get("target_offset", 0)),
         )
-
-    except subprocess.CalledProcessError as e:
-        raise FFmpegError(f"Loudness measurement failed: {e.stderr}")
-    except (json.JSONDecodeError, KeyError) as e:
+    except (orjson.JSONDecodeError, KeyError) as e:
         raise FFmpegError(f"Failed to parse loudness data: {e}")
 
 
+def measure_loudness(file_path: Path) -> LoudnessInfo:
+    """
+    Measure audio loudness using FFmpeg loudnorm filter.
+
+    Args:
+        file_path: Path to audio/video file.
+
+    Returns:
+        LoudnessInfo with measured values.
+    """
+    cmd = [
+        _ffmpeg(),
+        "-threads", "0",
+        "-i", str(file_path),
+        "-vn", "-sn", "-dn",  # Only the audio needs decoding
+        "-af", "loudnorm=print_format=json",
+        "-f", "null",
+        "-",
+    ]
+
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    # loudnorm output is in stderr
+    return _parse_loudnorm_stats(result.stderr)
+
+
 def normalize_audio(
     input_path: Path,
     output_path: Path,
     target_lufs: float = TARGET_LUFS,
+    two_pass: bool = True,
 ) -> tuple[Path, LoudnessInfo]:
     """
-    Normalize audio loudness using two-pass loudnorm filter.
+    Normalize audio loudness using the loudnorm filter.
+
+    Two-pass mode measures the input first and then applies linear
+    normalization. Single-pass mode decodes the input only once and uses
+    loudnorm's dynamic mode, which is less exact but about twice as fast.
 
     Args:
         input_path: Input file path.
         output_path: Output file path.
         target_lufs: Target loudness in LUFS (default -16).
+        two_pass: Measure loudness in a separate first pass (default True).
 
     Returns:
         Tuple of (output path, loudness info).
     """
-    # First pass: measure loudness
-    loudness = measure_loudness(input_path)
-
-    # Second pass: apply normalization
-    loudnorm_filter = (
-        f"loudnorm=I={target_lufs}:TP=-1.5:LRA=11:"
-        f"measured_I={loudness.input_i}:"
-        f"measured_TP={loudness.input_tp}:"
-        f"measured_LRA={loudness.input_lra}:"
-        f"measured_thresh={loudness.input_thresh}:"
-        f"offset={loudness.target_offset}:"
-        f"linear=true"
-    )
+    loudness = None
+    if two_pass:
+        # First pass: measure loudness
+        loudness = measure_loudness(input_path)
+
+        # Second pass: apply normalization
+        loudnorm_filter = (
+            f"loudnorm=I={target_lufs}:TP=-1.5:LRA=11:"
+            f"measured_I={loudness.input_i}:"
+            f"measured_TP={loudness.input_tp}:"
+            f"measured_LRA={loudness.input_lra}:"
+            f"measured_thresh={loudness.input_thresh}:"
+            f"offset={loudness.target_offset}:"
+            f"linear=true"
+        )
+    else:
+        # Input stats are printed at the end of the same run
+        loudnorm_filter = f"loudnorm=I={target_lufs}:TP=-1.5:LRA=11:print_format=json"
 
     cmd = [
-        "ffmpeg",
+        _ffmpeg(),
         "-i", str(input_path),
         "-af", loudnorm_filter,
         "-c:v", "copy",  # Copy video stream
@@ -310,10 +484,13 @@ def normalize_audio(
     ]
 
     try:
-        subprocess.run(cmd, capture_output=True, check=True)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
     except subprocess.CalledProcessError as e:
         raise FFmpegError(f"Audio normalization failed: {e.stderr.decode()}")
 
+    if loudness is None:
+        loudness = _parse_loudnorm_stats(result.stderr)
+
     return output_path, loudness
 
 
@@ -334,7 +511,7 @@ def mux_audio_video(
         Path to output file.
     """
     cmd = [
-        "ffmpeg",
+        _ffmpeg(),
         "-i", str(video_path),
         "-i", str(audio_path),
         "-c:v", "copy",
@@ -345,13 +522,39 @@ def mux_audio_video(
     ]
 
     try:
-        subprocess.run(cmd, capture_output=True, check=True)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
     except subprocess.CalledProcessError as e:
         raise FFmpegError(f"Audio/video muxing failed: {e.stderr.decode()}")
 
     return output_path
 
 
+def convert_audio(input_path: Path, output_path: Path) -> Path:
+    """
+    Re-encode an audio file into the format implied by the output suffix.
+
+    Args:
+        input_path: Input audio file path.
+        output_path: Output file path (its suffix picks container and codec).
+
+    Returns:
+        Path to output file.
+    """
+    cmd = [
+        _ffmpeg(),
+        "-i", str(input_path),
+        "-vn",
+        "-y", str(output_path),
+    ]
+
+    try:
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+    except subprocess.CalledProcessError as e:
+        raise FFmpegError(f"Audio conversion failed: {e.stderr.decode()}")
+
+    return output_path
+
+
 def get_file_format(file_path: Path) -> str:
     """Get file format extension, normalized."""
     suffix = file_path.suffix.lower().lstrip(".")
@@ -1,12 +1,20 @@
 """OpenAI LLM client for content analysis."""
 
-import json
-from typing import Optional
+import asyncio
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Optional
 
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI, OpenAI
 
 from smartcut.config import LLM_MODEL
+from smartcut.core.accent_words import pick_accent_words
 from smartcut.core.models import DuplicateGroup, DuplicateGroups
+from smartcut.core.openai_clients import get_async_openai_client, get_openai_client
+from smartcut.core.response_cache import ResponseCache, make_cache_key
 
 DUPLICATE_DETECTION_PROMPT = """You are analyzing a video transcript where the speaker often repeats the same phrase multiple times (multiple takes). The LAST take is always the best.
 
@@ -50,12 +58,175 @@ Rules:
 - Return words exactly as they appear (same case, same form)"""
 
 
+ACCENT_WORDS_BATCH_PROMPT = """For each subtitle text below, identify 2-4 key words that should be visually emphasized (highlighted in a different color). Choose important nouns, verbs, or key terms that carry the main meaning.
+
+Texts:
+{texts}
+
+Return JSON with one entry per text id:
+{{"results": [{{"id": 1, "accent_words": ["word1", "word2"]}}]}}
+
+Rules:
+- Choose 2-4 words maximum per text
+- Pick words that carry the core meaning
+- Don't accent common words like "и", "в", "на", "это", "the", "is", "a"
+- Return words exactly as they appear in their text (same case, same form)"""
+
+
+# Structured output schema for duplicate detection; the API guarantees
+# responses match it, so they validate straight into DuplicateGroups
+_INT_ARRAY = {"type": "array", "items": {"type": "integer"}}
+DUPLICATE_GROUPS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "duplicate_groups",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "groups": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "block_ids": _INT_ARRAY,
+                            "keep": {"type": "integer"},
+                            "remove": _INT_ARRAY,
+                            "reason": {"type": "string"},
+                        },
+                        "required": ["block_ids", "keep", "remove", "reason"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["groups"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def _duplicate_groups_from_result(result: dict) -> DuplicateGroups:
+    """
+    Build DuplicateGroups from a structured-output response.
+
+    The strict schema already guarantees the shape (cached entries too, since
+    the response format is part of the cache key), so validation is skipped;
+    anything unexpected falls back to full validation.
+    """
+    try:
+        return DuplicateGroups.model_construct(
+            groups=[
+                DuplicateGroup.model_construct(
+                    block_ids=g["block_ids"],
+                    keep=g["keep"],
+                    remove=g["remove"],
+                    reason=g["reason"],
+                )
+                for g in result["groups"]
+            ]
+        )
+    except (KeyError, TypeError):
+        return DuplicateGroups.model_validate(result)
+
+
+def _split_prompt(template: str, field: str) -> tuple[str, str]:
+    """Render a prompt template around its single field, returning (head, tail)."""
+    slot = "\0"
+    head, tail = template.format(**{field: slot}).split(slot)
+    return head, tail
+
+
+# Prompts rendered once; per call only the variable part is concatenated in
+_DUPLICATE_PROMPT_HEAD, _DUPLICATE_PROMPT_TAIL = _split_prompt(DUPLICATE_DETECTION_PROMPT, "blocks")
+_ACCENT_PROMPT_HEAD, _ACCENT_PROMPT_TAIL = _split_prompt(ACCENT_WORDS_PROMPT, "text")
+_ACCENT_BATCH_PROMPT_HEAD, _ACCENT_BATCH_PROMPT_TAIL = _split_prompt(ACCENT_WORDS_BATCH_PROMPT, "texts")
+
+
+MAX_CONCURRENT_REQUESTS = 10
+ACCENT_WORDS_BATCH_SIZE = 20  # Texts packed into one accent words request
+MAX_RETRIES = 3  # SDK-level retries with exponential backoff (rate limits, connection errors)
+
+ACCENT_WORDS_SYSTEM_PROMPT = "You are a subtitle styling assistant."
+DUPLICATE_DETECTION_SYSTEM_PROMPT = (
+    "You are a video editing assistant that identifies duplicate takes in transcripts."
+)
+
+
+@lru_cache(maxsize=1)
+def _response_cache() -> Optional[ResponseCache]:
+    """Process-wide cache of chat completion responses (None if it can't be opened)."""
+    try:
+        return ResponseCache("llm")
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: LLM response cache disabled: {e}", file=sys.stderr)
+        return None
+
+
 class LLMClient:
     """Client for OpenAI Chat API for content analysis."""
 
-    def __init__(self, api_key: str, model: Optional[str] = None):
-        self.client = OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: Optional[str] = None,
+        use_cache: bool = True,
+        openai_client: Optional[OpenAI] = None,
+        async_openai_client: Optional[AsyncOpenAI] = None,
+    ):
+        client = openai_client or get_openai_client(api_key)
+        aclient = async_openai_client or get_async_openai_client(api_key)
+        self.client = client.with_options(max_retries=MAX_RETRIES)
+        self.aclient = aclient.with_options(max_retries=MAX_RETRIES)
         self.model = model or LLM_MODEL
+        self.cache = _response_cache() if use_cache else None
+
+    def _cache_key(self, request: dict) -> str:
+        """Cache key for a chat completion request (model, prompts and sampling settings)."""
+        return make_cache_key(orjson.dumps(request, option=orjson.OPT_SORT_KEYS).decode())
+
+    def _cached_json(self, key: str) -> Optional[dict]:
+        """Return a cached parsed response, if any."""
+        if self.cache is None:
+            return None
+        content = self.cache.get(key)
+        return orjson.loads(content) if content is not None else None
+
+    def _complete_json(self, request: dict) -> dict:
+        """
+        Run a JSON-mode chat completion, answering repeated requests from the cache.
+
+        Args:
+            request: Chat completion arguments.
+
+        Returns:
+            Parsed JSON response.
+        """
+        key = self._cache_key(request)
+        cached = self._cached_json(key)
+        if cached is not None:
+            return cached
+
+        response = self.client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        result = orjson.loads(content)
+        if self.cache is not None:
+            self.cache.set(key, content)
+        return result
+
+    async def _acomplete_json(self, request: dict) -> dict:
+        """Async version of _complete_json."""
+        key = self._cache_key(request)
+        cached = self._cached_json(key)
+        if cached is not None:
+            return cached
+
+        response = await self.aclient.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        result = orjson.loads(content)
+        if self.cache is not None:
+            self.cache.set(key, content)
+        return result
 
     def detect_duplicates(self, paragraphs: list[dict]) -> DuplicateGroups:
         """
@@ -71,41 +242,39 @@ class LLMClient:
             return DuplicateGroups(groups=[])
 
         # Format blocks for the prompt
-        blocks_text = "\n".join(
-            f"[{p['id']}] \"{p['text']}\""
-            for p in paragraphs
-        )
+        blocks_text = "\n".join([f"[{p['id']}] \"{p['text']}\"" for p in paragraphs])
 
-        prompt = DUPLICATE_DETECTION_PROMPT.format(blocks=blocks_text)
+        prompt = f"{_DUPLICATE_PROMPT_HEAD}{blocks_text}{_DUPLICATE_PROMPT_TAIL}"
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a video editing assistant that identifies duplicate takes in transcripts."},
+            result = self._complete_json({
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": DUPLICATE_DETECTION_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
-                response_format={"type": "json_object"},
-                temperature=0.1,
-            )
-
-            result = json.loads(response.choices[0].message.content)
-            groups = [
-                DuplicateGroup(
-                    block_ids=g["block_ids"],
-                    keep=g["keep"],
-                    remove=g["remove"],
-                    reason=g.get("reason", ""),
-                )
-                for g in result.get("groups", [])
-            ]
-            return DuplicateGroups(groups=groups)
+                "response_format": DUPLICATE_GROUPS_RESPONSE_FORMAT,
+                "temperature": 0.1,
+            })
+            return _duplicate_groups_from_result(result)
 
         except Exception as e:
             # On error, return empty groups (no duplicates detected)
             print(f"Warning: Duplicate detection failed: {e}")
             return DuplicateGroups(groups=[])
 
+    def _accent_words_request(self, text: str) -> dict:
+        """Build chat completion arguments for an accent words request."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": ACCENT_WORDS_SYSTEM_PROMPT},
+                {"role": "user", "content": f"{_ACCENT_PROMPT_HEAD}{text}{_ACCENT_PROMPT_TAIL}"},
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0.3,
+        }
+
     def identify_accent_words(self, text: str) -> list[str]:
         """
         Identify words to accent/highlight in subtitle text.
@@ -119,36 +288,201 @@ class LLMClient:
         if not text or len(text.split()) < 3:
             return []
 
-        prompt = ACCENT_WORDS_PROMPT.format(text=text)
-
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a subtitle styling assistant."},
-                    {"role": "user", "content": prompt},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
+            result = self._complete_json(self._accent_words_request(text))
+            return result.get("accent_words", [])
+
+        except Exception as e:
+            print(f"Warning: Accent word identification failed: {e}")
+            return []
 
-            result = json.loads(response.choices[0].message.content)
+    def identify_accent_words_local(
+        self,
+        text: str,
+        idf: Optional[dict[str, float]] = None,
+        use_llm_fallback: bool = False,
+    ) -> list[str]:
+        """
+        Identify accent words with the local keyword scorer instead of the API.
+
+        Args:
+            text: Subtitle text.
+            idf: IDF table built over the whole transcript (see accent_words.build_idf).
+            use_llm_fallback: Ask the LLM when fewer than 2 candidates are found.
+
+        Returns:
+            List of words to highlight.
+        """
+        if not text or len(text.split()) < 3:
+            return []
+
+        words = pick_accent_words(text, idf)
+        if len(words) < 2 and use_llm_fallback:
+            return self.identify_accent_words(text)
+        return words
+
+    async def identify_accent_words_async(self, text: str) -> list[str]:
+        """
+        Identify words to accent/highlight in subtitle text (async).
+
+        Args:
+            text: Subtitle text.
+
+        Returns:
+            List of words to highlight.
+        """
+        if not text or len(text.split()) < 3:
+            return []
+
+        try:
+            result = await self._acomplete_json(self._accent_words_request(text))
             return result.get("accent_words", [])
 
         except Exception as e:
             print(f"Warning: Accent word identification failed: {e}")
             return []
 
+    def _accent_words_batch_request(self, items: list[tuple[int, str]]) -> dict:
+        """Build chat completion arguments for a packed accent words request."""
+        texts = "\n".join([f"[{item_id}] \"{text}\"" for item_id, text in items])
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": ACCENT_WORDS_SYSTEM_PROMPT},
+                {"role": "user", "content": f"{_ACCENT_BATCH_PROMPT_HEAD}{texts}{_ACCENT_BATCH_PROMPT_TAIL}"},
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0.3,
+        }
+
+    @staticmethod
+    def _parse_accent_words_batch(result: dict) -> dict[int, list[str]]:
+        """Map text id to accent words from a packed accent words response."""
+        found = {}
+        for entry in result.get("results", []):
+            words = entry.get("accent_words")
+            if isinstance(entry.get("id"), int) and isinstance(words, list):
+                found[entry["id"]] = words
+        return found
+
+    @staticmethod
+    def _accent_chunks(texts: list[str]) -> tuple[list[str], list[list[tuple[int, str]]]]:
+        """
+        Deduplicate texts worth accenting and split them into request chunks.
+
+        Returns:
+            (unique texts, chunks of (index into unique texts, text) pairs of
+            at most ACCENT_WORDS_BATCH_SIZE).
+        """
+        unique = list(dict.fromkeys(text for text in texts if text and len(text.split()) >= 3))
+        items = list(enumerate(unique))
+        chunks = [
+            items[k:k + ACCENT_WORDS_BATCH_SIZE]
+            for k in range(0, len(items), ACCENT_WORDS_BATCH_SIZE)
+        ]
+        return unique, chunks
+
+    @staticmethod
+    def _scatter_accent_words(
+        texts: list[str],
+        unique: list[str],
+        found_per_chunk: Iterable[dict[int, list[str]]],
+    ) -> list[list[str]]:
+        """Map per-chunk results back onto the original (possibly repeated) texts."""
+        words_by_text = {
+            unique[item_id]: words
+            for found in found_per_chunk
+            for item_id, words in found.items()
+        }
+        return [list(words_by_text.get(text, ())) for text in texts]
+
+    def _identify_accent_chunk(self, chunk: list[tuple[int, str]]) -> dict[int, list[str]]:
+        """Identify accent words for one chunk, falling back to per-text calls for gaps."""
+        try:
+            result = self._complete_json(self._accent_words_batch_request(chunk))
+            found = self._parse_accent_words_batch(result)
+        except Exception as e:
+            print(f"Warning: Batched accent word identification failed: {e}", file=sys.stderr)
+            found = {}
+
+        for item_id, text in chunk:
+            if item_id not in found:
+                found[item_id] = self.identify_accent_words(text)
+        return found
+
+    async def _identify_accent_chunk_async(
+        self,
+        chunk: list[tuple[int, str]],
+    ) -> dict[int, list[str]]:
+        """Async version of _identify_accent_chunk."""
+        try:
+            result = await self._acomplete_json(self._accent_words_batch_request(chunk))
+            found = self._parse_accent_words_batch(result)
+        except Exception as e:
+            print(f"Warning: Batched accent word identification failed: {e}", file=sys.stderr)
+            found = {}
+
+        missing = [(item_id, text) for item_id, text in chunk if item_id not in found]
+        if missing:
+            words = await asyncio.gather(
+                *(self.identify_accent_words_async(text) for _, text in missing)
+            )
+            found.update(zip((item_id for item_id, _ in missing), words))
+        return found
+
+    async def identify_accent_words_batch_async(
+        self,
+        texts: list[str],
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    ) -> list[list[str]]:
+        """
+        Identify accent words for multiple texts with concurrent requests.
+
+        Repeated texts are sent once; unique texts are packed
+        ACCENT_WORDS_BATCH_SIZE to a request.
+
+        Args:
+            texts: List of subtitle texts.
+            max_concurrent: Maximum number of requests in flight at once.
+
+        Returns:
+            List of accent word lists, one per input text.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def identify_chunk(chunk: list[tuple[int, str]]) -> dict[int, list[str]]:
+            async with semaphore:
+                return await self._identify_accent_chunk_async(chunk)
+
+        unique, chunks = self._accent_chunks(texts)
+        found_per_chunk = await asyncio.gather(*map(identify_chunk, chunks))
+        return self._scatter_accent_words(texts, unique, found_per_chunk)
+
     def identify_accent_words_batch(self, texts: list[str]) -> list[list[str]]:
         """
         Identify accent words for multiple texts efficiently.
 
+        Repeated texts are sent once; unique texts are packed
+        ACCENT_WORDS_BATCH_SIZE to a request and the requests run concurrently
+        on a thread pool. From async code, await identify_accent_words_batch_async
+        instead.
+
         Args:
             texts: List of subtitle texts.
 
         Returns:
             List of accent word lists, one per input text.
         """
-        # For efficiency, process in batches or individually
-        # For now, process individually (can be optimized later)
-        return [self.identify_accent_words(text) for text in texts]
+        unique, chunks = self._accent_chunks(texts)
+        if not chunks:
+            return [[] for _ in texts]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(chunks))) as executor:
+            found_per_chunk = list(executor.map(self._identify_accent_chunk, chunks))
+        return self._scatter_accent_words(texts, unique, found_per_chunk)
+
+
+@lru_cache(maxsize=4)
+def get_llm_client(api_key: str) -> LLMClient:
+    """Get the process-wide LLMClient for an API key (it holds no per-call state)."""
+    return LLMClient(api_key)
@@ -1,8 +1,10 @@
 """Pydantic data models for SmartCut."""
 
-from typing import Literal, Optional
+from functools import cached_property
+from itertools import chain
+from typing import Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Transcription models
@@ -32,12 +34,62 @@ class Transcription(BaseModel):
     duration: float
     segments: list[TranscriptionSegment] = Field(default_factory=list)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Transcription":
+        """
+        Build a transcription from a dict produced by the transcribe tool.
+
+        Skips per-word validation, which dominates for long transcripts;
+        data with missing keys or unexpected structure is fully validated
+        instead, so bad input still gets a proper validation error.
+        """
+        try:
+            return cls.model_construct(
+                language=data["language"],
+                duration=data["duration"],
+                segments=[
+                    TranscriptionSegment.model_construct(
+                        id=seg["id"],
+                        start=seg["start"],
+                        end=seg["end"],
+                        text=seg["text"],
+                        words=[
+                            TranscriptionWord.model_construct(
+                                word=w["word"], start=w["start"], end=w["end"]
+                            )
+                            for w in seg.get("words", ())
+                        ],
+                    )
+                    for seg in data.get("segments", ())
+                ],
+            )
+        except (KeyError, TypeError):
+            return cls.model_validate(data)
+
+    @cached_property
+    def all_words(self) -> list[TranscriptionWord]:
+        """Flat list of all words across all segments (built once, treat as read-only)."""
+        return list(chain.from_iterable(segment.words for segment in self.segments))
+
     def get_all_words(self) -> list[TranscriptionWord]:
         """Get flat list of all words across all segments."""
-        words = []
-        for segment in self.segments:
-            words.extend(segment.words)
-        return words
+        return self.all_words
+
+
+def parse_transcription(data: Union[dict, str, bytes, Transcription]) -> Transcription:
+    """
+    Parse transcription data passed to a tool.
+
+    Dicts take the fast Transcription.from_dict path; JSON text (some clients
+    send the transcribe result as a string) is parsed and validated in a
+    single pass by pydantic-core. An already parsed Transcription is returned
+    as is, so pipelines can parse once and share it between stages.
+    """
+    if isinstance(data, Transcription):
+        return data
+    if isinstance(data, (str, bytes)):
+        return Transcription.model_validate_json(data)
+    return Transcription.from_dict(data)
 
 
 # Analysis models
@@ -64,35 +116,38 @@ class CutSegment(BaseModel):
     reason: Optional[str] = None
 
 
+def _format_mm_ss(seconds: float) -> str:
+    """Format seconds as MM:SS."""
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes}:{secs:02d}"
+
+
 class CutStats(BaseModel):
     """Statistics about the cut plan."""
 
+    # Frozen so the cached formatted strings can never go stale
+    model_config = ConfigDict(frozen=True)
+
     original_duration: float
     kept_duration: float
     removed_duration: float
     duplicates_removed: int = 0
     silences_removed: int = 0
 
-    @property
+    @cached_property
     def time_saved_formatted(self) -> str:
         """Format removed duration as MM:SS."""
-        minutes = int(self.removed_duration // 60)
-        seconds = int(self.removed_duration % 60)
-        return f"{minutes}:{seconds:02d}"
+        return _format_mm_ss(self.removed_duration)
 
-    @property
+    @cached_property
     def original_duration_formatted(self) -> str:
         """Format original duration as MM:SS."""
-        minutes = int(self.original_duration // 60)
-        seconds = int(self.original_duration % 60)
-        return f"{minutes}:{seconds:02d}"
+        return _format_mm_ss(self.original_duration)
 
-    @property
+    @cached_property
     def kept_duration_formatted(self) -> str:
         """Format kept duration as MM:SS."""
-        minutes = int(self.kept_duration // 60)
-        seconds = int(self.kept_duration % 60)
-        return f"{minutes}:{seconds:02d}"
+        return _format_mm_ss(self.kept_duration)
 
 
 class CutPlan(BaseModel):
@@ -150,6 +205,7 @@ class MediaInfo(BaseModel):
     fps: float = 30.0
     audio_sample_rate: int = 44100
     format: str = "mov"
+    has_video: bool = True  # False for audio-only files (cover art doesn't count)
 
 
 class LoudnessInfo(BaseModel):
@@ -0,0 +1,32 @@
+"""Shared OpenAI clients so every caller reuses one connection pool per API key."""
+
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+# Sized for concurrent accent batches plus parallel Whisper chunk uploads
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Get the process-wide sync OpenAI client for an API key.
+
+    Callers needing different options should derive a copy with
+    ``client.with_options(...)``, which keeps the shared connection pool.
+    """
+    return OpenAI(
+        api_key=api_key,
+        http_client=DefaultHttpxClient(http2=True, limits=_LIMITS),
+    )
+
+
+@lru_cache(maxsize=4)
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get the process-wide async OpenAI client for an API key."""
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=DefaultAsyncHttpxClient(http2=True, limits=_LIMITS),
+    )
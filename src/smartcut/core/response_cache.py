@@ -0,0 +1,94 @@
+"""Persistent on-disk cache for API responses."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path.home() / ".cache" / "smartcut"
+DEFAULT_TTL_SEC = 30 * 24 * 3600  # 30 days
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+def make_cache_key(*parts: str) -> str:
+    """Hash key parts into a fixed-size cache key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed key/value cache with TTL and least-recently-used eviction.
+
+    Safe to share between threads. Values are stored as text.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float = DEFAULT_TTL_SEC,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Path = CACHE_DIR,
+    ):
+        """
+        Open (or create) a named cache.
+
+        Args:
+            name: Cache name; used as the database file name.
+            ttl: Seconds an entry stays valid after it was stored.
+            max_entries: Entries kept before the least recently used are evicted.
+            cache_dir: Directory holding cache databases.
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = cache_dir / f"{name}.sqlite3"
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """Store value under key, evicting least recently used entries if full."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY accessed LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
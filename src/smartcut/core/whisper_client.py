@@ -1,31 +1,113 @@
 """OpenAI Whisper API client for transcription."""
 
+import hashlib
+import mmap
+import os
+import random
+import sqlite3
+import tempfile
 import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
-from openai import OpenAI
+from openai import OpenAI, RateLimitError
 
 from smartcut.config import WHISPER_MODEL
+from smartcut.core.ffmpeg_utils import get_media_info, get_media_infos, split_audio
 from smartcut.core.models import Transcription, TranscriptionSegment, TranscriptionWord
+from smartcut.core.openai_clients import get_openai_client
+from smartcut.core.response_cache import ResponseCache, make_cache_key
 
 MAX_FILE_SIZE_MB = 25
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+CHUNK_TARGET_BYTES = 20 * 1024 * 1024  # Headroom below the API limit for container overhead
+MAX_CONCURRENT_CHUNKS = 4
 MAX_RETRIES = 3
 RETRY_DELAY_BASE = 2  # seconds
+CACHE_MAX_ENTRIES = 500  # Transcripts are large; keep the cache bounded
+
+
+def _file_digest(path: Path) -> str:
+    """Hash file contents in place through a read-only memory map."""
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:  # Empty files can't be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+    return digest.hexdigest()
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the API asked us to wait before retrying a rate-limited request."""
+    if not isinstance(error, RateLimitError):
+        return None
+    try:
+        return float(error.response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1)
+def _response_cache() -> Optional[ResponseCache]:
+    """Process-wide cache of transcriptions (None if it can't be opened)."""
+    try:
+        return ResponseCache("whisper", max_entries=CACHE_MAX_ENTRIES)
+    except (OSError, sqlite3.Error):
+        return None
 
 
 class WhisperClient:
     """Client for OpenAI Whisper API transcription."""
 
-    def __init__(self, api_key: str):
-        self.client = OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        use_cache: bool = True,
+        openai_client: Optional[OpenAI] = None,
+    ):
+        self.client = openai_client or get_openai_client(api_key)
         self.model = WHISPER_MODEL
+        self.cache = _response_cache() if use_cache else None
+
+    def _source_cache_key(self, source_fingerprint: str, language: Optional[str]) -> str:
+        """Cache key of the alias from a source file fingerprint to an audio cache key."""
+        return make_cache_key(self.model, language or "", "source", source_fingerprint)
+
+    def cached_for_source(
+        self,
+        source_fingerprint: str,
+        language: Optional[str] = None,
+    ) -> Optional[Transcription]:
+        """
+        Look up a cached transcription by source file fingerprint.
+
+        Lets callers skip audio extraction entirely. Only finds transcriptions
+        stored by transcribe() with the same source_fingerprint.
+
+        Args:
+            source_fingerprint: Fingerprint of the original media file.
+            language: Language code the transcription was requested with.
+
+        Returns:
+            Cached transcription, or None on a miss.
+        """
+        if self.cache is None:
+            return None
+        audio_key = self.cache.get(self._source_cache_key(source_fingerprint, language))
+        if audio_key is None:
+            return None
+        cached = self.cache.get(audio_key)
+        return Transcription.model_validate_json(cached) if cached is not None else None
 
     def transcribe(
         self,
         audio_path: Path,
         language: Optional[str] = None,
+        source_fingerprint: Optional[str] = None,
     ) -> Transcription:
         """
         Transcribe audio file using Whisper API.
@@ -33,16 +115,33 @@ class WhisperClient:
         Args:
             audio_path: Path to audio file (WAV, MP3, etc.)
             language: Language code (e.g., 'ru', 'en'). Auto-detect if None.
+            source_fingerprint: Fingerprint of the media the audio came from; the
+                result is then also reachable through cached_for_source().
 
         Returns:
             Transcription object with segments and word-level timestamps.
         """
+        # Re-running the pipeline on the same audio is answered from the cache
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(self.model, language or "", _file_digest(audio_path))
+            if source_fingerprint:
+                # Store only the key: the transcript itself is kept once, under the audio digest
+                self.cache.set(self._source_cache_key(source_fingerprint, language), cache_key)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return Transcription.model_validate_json(cached)
+
         file_size = audio_path.stat().st_size
 
         if file_size > MAX_FILE_SIZE_BYTES:
-            return self._transcribe_chunked(audio_path, language)
+            transcription = self._transcribe_chunked(audio_path, language)
+        else:
+            transcription = self._transcribe_single(audio_path, language)
 
-        return self._transcribe_single(audio_path, language)
+        if cache_key is not None:
+            self.cache.set(cache_key, transcription.model_dump_json())
+        return transcription
 
     def _transcribe_single(
         self,
@@ -50,6 +149,7 @@ class WhisperClient:
         language: Optional[str] = None,
     ) -> Transcription:
         """Transcribe a single audio file (under 25MB)."""
+        delay = RETRY_DELAY_BASE
         for attempt in range(MAX_RETRIES):
             try:
                 with open(audio_path, "rb") as audio_file:
@@ -68,8 +168,9 @@ class WhisperClient:
 
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_DELAY_BASE ** (attempt + 1)
-                    time.sleep(delay)
+                    # Decorrelated jitter keeps concurrent chunk workers from retrying in lockstep
+                    delay = random.uniform(RETRY_DELAY_BASE, delay * 3)
+                    time.sleep(_retry_after(e) or delay)
                 else:
                     raise RuntimeError(f"Whisper API error after {MAX_RETRIES} attempts: {e}")
 
@@ -83,61 +184,124 @@ class WhisperClient:
         """
         Transcribe large audio file by splitting into chunks.
 
-        Note: For simplicity, this implementation processes the file as-is
-        and relies on Whisper's ability to handle longer files. If this fails,
-        the caller should pre-split the audio using FFmpeg.
+        The file is split with FFmpeg into chunks under the API size limit,
+        chunks are transcribed concurrently, and their timestamps are shifted
+        by each chunk's offset before merging.
         """
-        # For now, attempt single transcription and raise clear error if it fails
-        try:
-            return self._transcribe_single(audio_path, language)
-        except Exception as e:
+        file_size = audio_path.stat().st_size
+        duration = get_media_info(audio_path).duration
+        if duration <= 0:
             raise RuntimeError(
-                f"Audio file is too large ({audio_path.stat().st_size / 1024 / 1024:.1f}MB). "
-                f"Maximum supported size is {MAX_FILE_SIZE_MB}MB. "
-                f"Please split the audio file or use a shorter video. Error: {e}"
+                f"Audio file is too large ({file_size / 1024 / 1024:.1f}MB) and its "
+                f"duration is unknown, so it can't be split. "
+                f"Maximum supported size is {MAX_FILE_SIZE_MB}MB."
             )
+        segment_seconds = duration * CHUNK_TARGET_BYTES / file_size
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            chunk_paths = split_audio(audio_path, Path(temp_dir), segment_seconds)
+
+            # Offsets come from actual chunk lengths; splits land on packet boundaries
+            offsets = []
+            offset = 0.0
+            for info in get_media_infos(chunk_paths):
+                offsets.append(offset)
+                offset += info.duration
+
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CHUNKS) as executor:
+                parts = list(
+                    executor.map(lambda p: self._transcribe_single(p, language), chunk_paths)
+                )
+
+        # offset now holds the summed chunk lengths, i.e. the full audio duration
+        return self._merge_transcriptions(parts, offsets, total_duration=offset)
+
+    @staticmethod
+    def _merge_transcriptions(
+        parts: list[Transcription],
+        offsets: list[float],
+        total_duration: Optional[float] = None,
+    ) -> Transcription:
+        """
+        Concatenate chunk transcriptions, shifting timestamps by chunk offsets.
+
+        Args:
+            parts: Per-chunk transcriptions in playback order.
+            offsets: Start of each chunk in the full audio (seconds).
+            total_duration: Full audio length; includes trailing silence after
+                the last word. Falls back to the last chunk's offset plus its duration.
+        """
+        segments = []
+        for part, offset in zip(parts, offsets):
+            for seg in part.segments:
+                segments.append(
+                    TranscriptionSegment(
+                        id=len(segments),
+                        start=seg.start + offset,
+                        end=seg.end + offset,
+                        text=seg.text,
+                        words=[
+                            TranscriptionWord(word=w.word, start=w.start + offset, end=w.end + offset)
+                            for w in seg.words
+                        ],
+                    )
+                )
+
+        return Transcription(
+            language=parts[0].language if parts else "unknown",
+            duration=total_duration if total_duration is not None else (
+                offsets[-1] + parts[-1].duration if parts else 0.0
+            ),
+            segments=segments,
+        )
 
     def _parse_response(self, response) -> Transcription:
         """Parse Whisper API response into Transcription model."""
+        # One conversion to plain dicts beats per-field attribute lookups on SDK objects
+        data = response.model_dump()
         segments = []
 
-        # Get words if available
-        all_words = getattr(response, "words", []) or []
-
-        for i, seg in enumerate(response.segments or []):
-            # Find words belonging to this segment
-            segment_words = []
-            for word_data in all_words:
-                word_start = getattr(word_data, "start", None)
-                word_end = getattr(word_data, "end", None)
-                word_text = getattr(word_data, "word", "")
-
-                if word_start is not None and word_end is not None:
-                    # Check if word falls within segment timerange
-                    if seg.start <= word_start < seg.end:
-                        segment_words.append(
-                            TranscriptionWord(
-                                word=word_text.strip(),
-                                start=word_start,
-                                end=word_end,
-                            )
-                        )
+        # Materialize timed words once, sorted by start so each segment's words
+        # form a contiguous run that can be found by binary search
+        timed_words = sorted(
+            (
+                (word_start, word_end, word_data.get("word") or "")
+                for word_data in data.get("words") or ()
+                if (word_start := word_data.get("start")) is not None
+                and (word_end := word_data.get("end")) is not None
+            ),
+            key=itemgetter(0),
+        )
+        word_starts = [w[0] for w in timed_words]
+
+        for i, seg in enumerate(data.get("segments") or ()):
+            seg_start = seg["start"]
+            seg_end = seg["end"]
+            # Words falling within segment timerange: seg.start <= start < seg.end
+            lo = bisect_left(word_starts, seg_start)
+            hi = bisect_left(word_starts, seg_end, lo)
+            segment_words = [
+                TranscriptionWord(word=word_text.strip(), start=word_start, end=word_end)
+                for word_start, word_end, word_text in timed_words[lo:hi]
+            ]
 
             segments.append(
                 TranscriptionSegment(
                     id=i,
-                    start=seg.start,
-                    end=seg.end,
-                    text=seg.text.strip(),
+                    start=seg_start,
+                    end=seg_end,
+                    text=seg["text"].strip(),
                     words=segment_words,
                 )
             )
 
         # Detect language from response or default
-        detected_language = getattr(response, "language", "unknown")
+        detected_language = data.get("language") or "unknown"
 
-        # Calculate duration from last segment end time
-        duration = segments[-1].end if segments else 0.0
+        # Whisper reports the full audio length; the last segment end misses trailing silence
+        duration = data.get("duration")
+        if duration is None:
+            duration = segments[-1].end if segments else 0.0
 
         return Transcription(
             language=detected_language,
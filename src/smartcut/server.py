@@ -1,13 +1,13 @@
 """SmartCut MCP Server - entry point."""
 
-import json
-from typing import Any
+from typing import Any, Awaitable, Callable
 
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from smartcut.config import can_modify_capcut, can_modify_source
+from smartcut.config import can_modify_capcut, can_modify_source, get_settings
 from smartcut.core.ffmpeg_utils import check_ffmpeg_installed
 from smartcut.tools.analyze import analyze_content
 from smartcut.tools.audio_enhance import enhance_audio
@@ -27,6 +27,11 @@ from smartcut.tools.video_export import export_video
 # Create server instance
 server = Server("smartcut")
 
+# orjson never escapes non-ASCII; non-string keys are stringified like json.dumps does.
+# Responses are read by programs, so indentation is opt-in via SMARTCUT_PRETTY_JSON.
+_RESULT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+_PRETTY_RESULT_JSON_OPTIONS = _RESULT_JSON_OPTIONS | orjson.OPT_INDENT_2
+
 
 def _get_readonly_tools() -> list[Tool]:
     """Get read-only tools (always available)."""
@@ -106,6 +111,11 @@ def _get_readonly_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Path for SRT file output",
                     },
+                    "return_srt_content": {
+                        "type": "boolean",
+                        "description": "Include the SRT text in the result (set false when only the file is needed)",
+                        "default": True,
+                    },
                 },
                 "required": ["transcription_data", "cut_plan_data"],
             },
@@ -366,6 +376,11 @@ def _get_source_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Output file path (auto-generated if not set)",
                     },
+                    "single_pass": {
+                        "type": "boolean",
+                        "description": "Normalize in one pass: about 2x faster but less exact (default false)",
+                        "default": False,
+                    },
                 },
                 "required": ["file_path"],
             },
@@ -431,67 +446,68 @@ def _get_smart_cut_tool() -> Tool:
     )
 
 
+# Tool definitions never change at runtime, so build them once
+_SMART_CUT_TOOL = _get_smart_cut_tool()
+_READONLY_TOOLS = _get_readonly_tools()
+_CAPCUT_TOOLS = _get_capcut_tools()
+_SOURCE_TOOLS = _get_source_tools()
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools based on SMARTCUT_ALLOWED_TARGETS setting."""
     tools = []
+    capcut_allowed = can_modify_capcut()
+    source_allowed = can_modify_source()
 
     # smart_cut is special - it can output to either, so include if any is allowed
-    if can_modify_capcut() or can_modify_source():
-        tools.append(_get_smart_cut_tool())
+    if capcut_allowed or source_allowed:
+        tools.append(_SMART_CUT_TOOL)
 
     # Always include read-only tools
-    tools.extend(_get_readonly_tools())
+    tools.extend(_READONLY_TOOLS)
 
     # Add CapCut tools if allowed
-    if can_modify_capcut():
-        tools.extend(_get_capcut_tools())
+    if capcut_allowed:
+        tools.extend(_CAPCUT_TOOLS)
 
     # Add source file tools if allowed
-    if can_modify_source():
-        tools.extend(_get_source_tools())
+    if source_allowed:
+        tools.extend(_SOURCE_TOOLS)
 
     return tools
 
 
+# Tool name -> async handler returning a JSON-serializable dict
+_TOOL_HANDLERS: dict[str, Callable[..., Awaitable[dict]]] = {
+    "smart_cut": smart_cut,
+    "transcribe": transcribe,
+    "analyze_content": analyze_content,
+    "generate_capcut_project": generate_capcut_project,
+    "export_video": export_video,
+    "generate_subtitles": generate_subtitles,
+    "enhance_audio": enhance_audio,
+    "normalize_audio": normalize_audio_loudness,
+    "list_capcut_projects": list_capcut_projects,
+    "open_capcut_project": open_capcut_project,
+    "add_subtitles_to_project": add_subtitles_to_project,
+    "smart_cut_project": smart_cut_project,
+}
+
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     try:
-        if name == "smart_cut":
-            result = await smart_cut(**arguments)
-        elif name == "transcribe":
-            result = await transcribe(**arguments)
-        elif name == "analyze_content":
-            result = await analyze_content(**arguments)
-        elif name == "generate_capcut_project":
-            result = await generate_capcut_project(**arguments)
-        elif name == "export_video":
-            result = await export_video(**arguments)
-        elif name == "generate_subtitles":
-            result = await generate_subtitles(**arguments)
-        elif name == "enhance_audio":
-            result = await enhance_audio(**arguments)
-        elif name == "normalize_audio":
-            result = await normalize_audio_loudness(**arguments)
-        elif name == "list_capcut_projects":
-            result = await list_capcut_projects(**arguments)
-        elif name == "open_capcut_project":
-            result = await open_capcut_project(**arguments)
-        elif name == "add_subtitles_to_project":
-            result = await add_subtitles_to_project(**arguments)
-        elif name == "smart_cut_project":
-            result = await smart_cut_project(**arguments)
-        else:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        result = await handler(**arguments)
 
-        return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+        options = _PRETTY_RESULT_JSON_OPTIONS if get_settings().pretty_json else _RESULT_JSON_OPTIONS
+        return [TextContent(type="text", text=orjson.dumps(result, option=options).decode())]
 
-    except FileNotFoundError as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
-    except ValueError as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
-    except RuntimeError as e:
+    except (FileNotFoundError, ValueError, RuntimeError) as e:
         return [TextContent(type="text", text=f"Error: {e}")]
     except Exception as e:
         return [TextContent(type="text", text=f"Unexpected error: {type(e).__name__}: {e}")]
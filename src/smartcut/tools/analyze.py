@@ -1,17 +1,21 @@
 """Analyze tool - analyzes transcription for duplicates and pauses."""
 
-from typing import Optional
+import asyncio
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Optional, Union
 
 from smartcut.config import SILENCE_THRESHOLD_SEC, get_settings
-from smartcut.core.llm_client import LLMClient
+from smartcut.core.llm_client import get_llm_client
 from smartcut.core.models import (
     AnalysisResult,
     CutPlan,
     CutSegment,
     CutStats,
+    DuplicateGroup,
     Paragraph,
     Transcription,
-    TranscriptionWord,
+    parse_transcription,
 )
 
 
@@ -29,54 +33,63 @@ def find_paragraphs(
     Returns:
         List of paragraphs.
     """
-    all_words = transcription.get_all_words()
+    all_words = transcription.all_words
     if not all_words:
         return []
 
+    # Read each word's fields once into plain lists
+    starts = [w.start for w in all_words]
+    ends = [w.end for w in all_words]
+    texts = [w.word for w in all_words]
+
+    # Index of each word followed by a long enough pause to end a paragraph
+    break_after = [
+        i
+        for i, (end, next_start) in enumerate(zip(ends, starts[1:]))
+        if next_start - end >= silence_threshold
+    ]
+    break_after.append(len(all_words) - 1)
+
     paragraphs = []
-    current_words: list[TranscriptionWord] = []
-    paragraph_id = 0
-
-    for i, word in enumerate(all_words):
-        current_words.append(word)
-
-        # Check for pause before next word
-        if i < len(all_words) - 1:
-            next_word = all_words[i + 1]
-            pause_duration = next_word.start - word.end
-
-            if pause_duration >= silence_threshold:
-                # End current paragraph
-                if current_words:
-                    paragraphs.append(
-                        Paragraph(
-                            id=paragraph_id,
-                            start=current_words[0].start,
-                            end=current_words[-1].end,
-                            text=" ".join(w.word for w in current_words),
-                            action="keep",  # Default, will be updated by duplicate detection
-                            reason="",
-                        )
-                    )
-                    paragraph_id += 1
-                    current_words = []
-
-    # Add last paragraph
-    if current_words:
+    first = 0
+    for paragraph_id, last in enumerate(break_after):
         paragraphs.append(
             Paragraph(
                 id=paragraph_id,
-                start=current_words[0].start,
-                end=current_words[-1].end,
-                text=" ".join(w.word for w in current_words),
-                action="keep",
+                start=starts[first],
+                end=ends[last],
+                text=" ".join(texts[first:last + 1]),
+                action="keep",  # Default, will be updated by duplicate detection
                 reason="",
             )
         )
+        first = last + 1
 
     return paragraphs
 
 
+def _apply_duplicate_result(
+    p: Paragraph,
+    remove_ids: set[int],
+    group_map: dict[int, DuplicateGroup],
+) -> Paragraph:
+    """Mark a paragraph as a removed duplicate take, the best take, or leave it as is."""
+    group = group_map.get(p.id)
+    if p.id in remove_ids:
+        reason = f"duplicate_take: {group.reason}" if group else "duplicate_take"
+        return p.model_copy(
+            update={
+                "action": "remove",
+                "reason": reason,
+                "group_id": group.keep if group else None,
+            }
+        )
+    if group is not None:
+        # This is the "keep" version
+        return p.model_copy(update={"action": "keep", "reason": "best_take", "group_id": p.id})
+    return p
+
+
 def detect_duplicates_in_paragraphs(
     paragraphs: list[Paragraph],
     api_key: str,
@@ -94,7 +107,7 @@ def detect_duplicates_in_paragraphs(
     if not paragraphs:
         return paragraphs
 
-    client = LLMClient(api_key)
+    client = get_llm_client(api_key)
 
     # Prepare data for LLM
     paragraph_data = [{"id": p.id, "text": p.text} for p in paragraphs]
@@ -103,48 +116,11 @@ def detect_duplicates_in_paragraphs(
     duplicate_result = client.detect_duplicates(paragraph_data)
 
     # Update paragraphs based on detection
-    remove_ids = set()
-    group_map = {}
-
-    for group in duplicate_result.groups:
-        for block_id in group.remove:
-            remove_ids.add(block_id)
-        for block_id in group.block_ids:
-            group_map[block_id] = group
-
-    updated_paragraphs = []
-    for p in paragraphs:
-        if p.id in remove_ids:
-            group = group_map.get(p.id)
-            reason = f"duplicate_take: {group.reason}" if group else "duplicate_take"
-            updated_paragraphs.append(
-                Paragraph(
-                    id=p.id,
-                    start=p.start,
-                    end=p.end,
-                    text=p.text,
-                    action="remove",
-                    reason=reason,
-                    group_id=group.keep if group else None,
-                )
-            )
-        elif p.id in group_map:
-            # This is the "keep" version
-            updated_paragraphs.append(
-                Paragraph(
-                    id=p.id,
-                    start=p.start,
-                    end=p.end,
-                    text=p.text,
-                    action="keep",
-                    reason="best_take",
-                    group_id=p.id,
-                )
-            )
-        else:
-            updated_paragraphs.append(p)
+    groups = duplicate_result.groups
+    remove_ids = {block_id for group in groups for block_id in group.remove}
+    group_map = {block_id: group for group in groups for block_id in group.block_ids}
 
-    return updated_paragraphs
+    return [_apply_duplicate_result(p, remove_ids, group_map) for p in paragraphs]
 
 
 def build_cut_plan(
@@ -166,12 +142,20 @@ def build_cut_plan(
     keep_segments = []
     remove_segments = []
 
-    # Sort paragraphs by start time
-    sorted_paragraphs = sorted(paragraphs, key=lambda p: p.start)
+    # Paragraphs from find_paragraphs are already in time order; sort only if not
+    sorted_paragraphs = paragraphs
+    if any(a.start > b.start for a, b in zip(paragraphs, paragraphs[1:])):
+        sorted_paragraphs = sorted(paragraphs, key=attrgetter("start"))
+
+    # Words are in time order, so each paragraph's words are found by binary search
+    all_words = transcription.all_words
+    word_starts = [w.start for w in all_words]
 
     prev_end = 0.0
     duplicates_removed = 0
     silences_removed = 0
+    kept_duration = 0.0
+    removed_duration = 0.0
 
     for p in sorted_paragraphs:
         # Check for silence gap before this paragraph
@@ -184,16 +168,14 @@ def build_cut_plan(
                 )
             )
             silences_removed += 1
+            removed_duration += p.start - prev_end
 
         if p.action == "keep":
-            # Find first and last words for this paragraph
-            all_words = transcription.get_all_words()
-            paragraph_words = [
-                w for w in all_words
-                if p.start <= w.start <= p.end
-            ]
-            start_word = paragraph_words[0].word if paragraph_words else ""
-            end_word = paragraph_words[-1].word if paragraph_words else ""
+            # First and last words with p.start <= word.start <= p.end
+            lo = bisect_left(word_starts, p.start)
+            hi = bisect_right(word_starts, p.end, lo)
+            start_word = all_words[lo].word if lo < hi else ""
+            end_word = all_words[hi - 1].word if lo < hi else ""
 
             keep_segments.append(
                 CutSegment(
@@ -203,6 +185,7 @@ def build_cut_plan(
                     end_word=end_word,
                 )
             )
+            kept_duration += p.end - p.start
             prev_end = p.end
         else:
             remove_segments.append(
@@ -213,12 +196,9 @@ def build_cut_plan(
                 )
             )
             duplicates_removed += 1
+            removed_duration += p.end - p.start
             prev_end = p.end
 
-    # Calculate statistics
-    kept_duration = sum(s.end - s.start for s in keep_segments)
-    removed_duration = sum(s.end - s.start for s in remove_segments)
-
     stats = CutStats(
         original_duration=transcription.duration,
         kept_duration=kept_duration,
@@ -235,7 +215,7 @@ def build_cut_plan(
 
 
 async def analyze_content(
-    transcription_data: dict,
+    transcription_data: Union[dict, Transcription],
     silence_threshold_sec: float = SILENCE_THRESHOLD_SEC,
     duplicate_detection: bool = True,
 ) -> dict:
@@ -243,7 +223,7 @@ async def analyze_content(
     Analyze transcription to identify paragraphs, duplicates, and pauses.
 
     Args:
-        transcription_data: Transcription data from transcribe tool.
+        transcription_data: Transcription data from transcribe tool (or a parsed Transcription).
         silence_threshold_sec: Minimum pause to consider as paragraph break.
         duplicate_detection: Whether to detect duplicate takes using LLM.
 
@@ -251,7 +231,7 @@ async def analyze_content(
         Analysis result with paragraphs and cut plan.
     """
     # Parse transcription
-    transcription = Transcription(**transcription_data)
+    transcription = parse_transcription(transcription_data)
 
     # Find paragraphs
     paragraphs = find_paragraphs(transcription, silence_threshold_sec)
@@ -260,26 +240,27 @@ async def analyze_content(
     if duplicate_detection and paragraphs:
         settings = get_settings()
         if settings.openai_api_key:
-            paragraphs = detect_duplicates_in_paragraphs(paragraphs, settings.openai_api_key)
+            paragraphs = await asyncio.to_thread(
+                detect_duplicates_in_paragraphs, paragraphs, settings.openai_api_key
+            )
 
     # Build cut plan
     cut_plan = build_cut_plan(paragraphs, transcription, silence_threshold_sec)
 
     result = AnalysisResult(paragraphs=paragraphs, cut_plan=cut_plan)
 
+    # One model_dump serializes the whole tree in pydantic-core
+    dumped = result.model_dump()
+
     return {
-        "paragraphs": [p.model_dump() for p in result.paragraphs],
-        "cut_plan": {
-            "keep_segments": [s.model_dump() for s in result.cut_plan.keep_segments],
-            "remove_segments": [s.model_dump() for s in result.cut_plan.remove_segments],
-            "stats": result.cut_plan.stats.model_dump(),
-        },
+        "paragraphs": dumped["paragraphs"],
+        "cut_plan": dumped["cut_plan"],
         "summary": {
             "original_duration": result.cut_plan.stats.original_duration_formatted,
             "final_duration": result.cut_plan.stats.kept_duration_formatted,
             "time_saved": result.cut_plan.stats.time_saved_formatted,
             "paragraphs_total": len(paragraphs),
-            "paragraphs_kept": len([p for p in paragraphs if p.action == "keep"]),
+            "paragraphs_kept": len(result.cut_plan.keep_segments),  # One per kept paragraph
             "duplicates_removed": result.cut_plan.stats.duplicates_removed,
             "silences_removed": result.cut_plan.stats.silences_removed,
         },
@@ -1,12 +1,19 @@
 """Audio Enhance tool - enhances audio using Auphonic API."""
 
+import asyncio
+import shutil
 import tempfile
 from pathlib import Path
 from typing import Optional
 
 from smartcut.config import can_modify_source, get_settings
 from smartcut.core.auphonic_client import AuphonicClient
-from smartcut.core.ffmpeg_utils import extract_audio, mux_audio_video
+from smartcut.core.ffmpeg_utils import (
+    convert_audio,
+    extract_audio,
+    get_media_info,
+    mux_audio_video,
+)
 
 
 async def enhance_audio(
@@ -26,7 +33,7 @@ async def enhance_audio(
     Requires AUPHONIC_API_KEY environment variable.
 
     Args:
-        file_path: Path to the video file.
+        file_path: Path to the video or audio file.
         preset_uuid: Auphonic preset UUID. Uses AUPHONIC_PRESET_UUID env var if not set.
         output_path: Output file path. Auto-generated if not set.
 
@@ -41,8 +48,10 @@ async def enhance_audio(
         }
 
     path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
     settings = get_settings()
 
@@ -57,6 +66,9 @@ async def enhance_audio(
     # Use preset from parameter or environment
     preset = preset_uuid or settings.auphonic_preset_uuid
 
+    # Audio-only input is uploaded as is; video needs its audio extracted and muxed back
+    has_video = (await asyncio.to_thread(get_media_info, path, st)).has_video
+
     # Determine output path
     if output_path:
         out_path = Path(output_path)
@@ -66,29 +78,43 @@ async def enhance_audio(
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
-        # Extract audio
-        audio_path = temp_path / "audio.wav"
-        extract_audio(path, audio_path, sample_rate=44100)
+        # FFmpeg steps run in worker threads so concurrent enhancements overlap
+        # one file's extract/mux with another's upload, polling and download
+        if has_video:
+            # Extract audio
+            audio_path = temp_path / "audio.wav"
+            await asyncio.to_thread(extract_audio, path, audio_path, sample_rate=44100)
+        else:
+            audio_path = path
 
         # Process with Auphonic
-        client = AuphonicClient(settings.auphonic_api_key)
-        enhanced_audio_path = temp_path / "enhanced.wav"
-
         try:
-            production_uuid = client.create_production(
-                audio_path=audio_path,
-                preset_uuid=preset,
-                title=f"SmartCut: {path.name}",
-            )
+            async with AuphonicClient(settings.auphonic_api_key) as client:
+                production_uuid = await client.create_production(
+                    audio_path=audio_path,
+                    preset_uuid=preset,
+                    title=f"SmartCut: {path.name}",
+                )
+
+                status = await client.poll_until_done(production_uuid)
 
-            client.poll_until_done(production_uuid)
-            client.download_result(production_uuid, enhanced_audio_path)
+                # The preset decides the output format; keep its extension on the download
+                output_files = status.data.get("output_files") or [{}]
+                ending = (output_files[0].get("ending") or "wav").lstrip(".")
+                enhanced_audio_path = temp_path / f"enhanced.{ending}"
+                await client.download_result(production_uuid, enhanced_audio_path, status.data)
 
         except Exception as e:
             raise RuntimeError(f"Auphonic processing failed: {e}")
 
-        # Mux enhanced audio back into video
-        mux_audio_video(path, enhanced_audio_path, out_path)
+        if has_video:
+            # Mux enhanced audio back into video
+            await asyncio.to_thread(mux_audio_video, path, enhanced_audio_path, out_path)
+        elif enhanced_audio_path.suffix.lower() == out_path.suffix.lower():
+            shutil.move(enhanced_audio_path, out_path)
+        else:
+            # Preset format differs from the requested file type; re-encode to match it
+            await asyncio.to_thread(convert_audio, enhanced_audio_path, out_path)
 
     return {
         "enhanced_file_path": str(out_path.absolute()),
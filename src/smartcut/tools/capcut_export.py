@@ -1,12 +1,16 @@
 """CapCut Export tool - generates CapCut draft project from cut plan."""
 
+import asyncio
+from dataclasses import replace
+from itertools import accumulate, cycle, repeat
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 
 from smartcut.config import MICROSECONDS_PER_SECOND, get_settings
 from smartcut.core.capcut_draft import CapCutDraft, TextStyle
 from smartcut.core.ffmpeg_utils import get_media_info
-from smartcut.core.models import CutPlan, CutSegment, Transcription
+from smartcut.core.models import CutPlan, CutSegment, Transcription, parse_transcription
+from smartcut.tools.subtitles import group_words_into_lines, map_words_to_timeline
 
 
 def seconds_to_microseconds(seconds: float) -> int:
@@ -20,7 +24,7 @@ async def generate_capcut_project(
     project_name: Optional[str] = None,
     add_subtitles: bool = True,
     subtitle_style: Literal["dynamic", "simple"] = "dynamic",
-    transcription_data: Optional[dict] = None,
+    transcription_data: Optional[Union[dict, Transcription]] = None,
 ) -> dict:
     """
     Generate a CapCut draft project from a cut plan.
@@ -34,17 +38,19 @@ async def generate_capcut_project(
         project_name: Name for the project (auto-generated if not set).
         add_subtitles: Whether to add subtitle track.
         subtitle_style: Style for subtitles - 'dynamic' or 'simple'.
-        transcription_data: Transcription data (needed for subtitles).
+        transcription_data: Transcription data or a parsed Transcription (needed for subtitles).
 
     Returns:
         Project path and instructions.
     """
     path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
-    # Get video info
-    media_info = get_media_info(path)
+    # Get video info (ffprobe runs in a thread so concurrent pipeline stages keep going)
+    media_info = await asyncio.to_thread(get_media_info, path, st)
 
     # Parse cut plan
     keep_segments = [
@@ -56,7 +62,7 @@ async def generate_capcut_project(
 
     # Get settings and drafts directory
     settings = get_settings()
-    drafts_dir = settings.get_capcut_drafts_path()
+    drafts_dir = settings.capcut_drafts_path
 
     # Create drafts directory if needed
     drafts_dir.mkdir(parents=True, exist_ok=True)
@@ -81,20 +87,15 @@ async def generate_capcut_project(
         height=media_info.height,
     )
 
-    # Add video segments
-    timeline_position = 0
-    for segment in keep_segments:
-        source_start_us = seconds_to_microseconds(segment.start)
-        duration_us = seconds_to_microseconds(segment.end - segment.start)
-
-        draft.add_video_segment(
-            material_id=material_id,
-            timeline_start_us=timeline_position,
-            source_start_us=source_start_us,
-            duration_us=duration_us,
-        )
-
-        timeline_position += duration_us
+    # Add video segments back to back; each starts where the previous one ends
+    # Same truncation as seconds_to_microseconds, inlined to skip a call per segment
+    us = MICROSECONDS_PER_SECOND
+    source_starts_us = [int(s.start * us) for s in keep_segments]
+    durations_us = [int((s.end - s.start) * us) for s in keep_segments]
+    timeline_starts_us = accumulate(durations_us[:-1], initial=0)
+    draft.add_video_segments(
+        material_id, zip(timeline_starts_us, source_starts_us, durations_us)
+    )
 
     # Add subtitles if requested and transcription is available
     if add_subtitles and transcription_data:
@@ -106,7 +107,7 @@ async def generate_capcut_project(
         )
 
     # Save project
-    project_path = draft.save(drafts_dir)
+    project_path = await asyncio.to_thread(draft.save, drafts_dir)
 
     return {
         "project_path": str(project_path),
@@ -119,18 +120,16 @@ async def generate_capcut_project(
 
 async def _add_subtitles_to_draft(
     draft: CapCutDraft,
-    transcription_data: dict,
+    transcription_data: Union[dict, Transcription],
     keep_segments: list[CutSegment],
     style: Literal["dynamic", "simple"],
 ) -> None:
     """Add subtitle segments to CapCut draft."""
-    from smartcut.tools.subtitles import map_words_to_timeline, group_words_into_lines
-
-    transcription = Transcription(**transcription_data)
+    transcription = parse_transcription(transcription_data)
 
     # Map words to new timeline
     timeline_words = map_words_to_timeline(
-        transcription.get_all_words(),
+        transcription.all_words,
         keep_segments,
     )
 
@@ -140,25 +139,29 @@ async def _add_subtitles_to_draft(
     # Group into subtitle lines
     subtitle_lines = group_words_into_lines(timeline_words)
 
-    # Add subtitle segments
-    position_toggle = False  # Alternate between top and bottom for dynamic style
-
-    for line in subtitle_lines:
-        # Create style
-        if style == "dynamic":
-            position_y = 0.2 if position_toggle else 0.8
-            position_toggle = not position_toggle
-        else:
-            position_y = 0.8
-
-        text_style = TextStyle(
+    # Build the styles once; dynamic style alternates bottom and top, starting at the bottom
+    if style == "dynamic":
+        bottom = TextStyle(
             font_size=8,
             font_color="#FFFFFF",
-            background_color="#000000" if style == "simple" else None,
-            background_alpha=0.6 if style == "simple" else 0.0,
-            position_y=position_y,
+            background_color=None,
+            background_alpha=0.0,
+            position_y=0.8,
+        )
+        line_styles = cycle((bottom, replace(bottom, position_y=0.2)))
+    else:
+        line_styles = repeat(
+            TextStyle(
+                font_size=8,
+                font_color="#FFFFFF",
+                background_color="#000000",
+                background_alpha=0.6,
+                position_y=0.8,
+            )
         )
 
+    # Add subtitle segments
+    for line, text_style in zip(subtitle_lines, line_styles):
         # Add text material
         material_id = draft.add_text_material(line["text"], text_style)
 
@@ -1,8 +1,13 @@
 """MCP tools for working with existing CapCut projects."""
 
+import asyncio
+import re
+from itertools import chain
 from pathlib import Path
 from typing import Literal, Optional
 
+from pydantic import TypeAdapter
+
 from smartcut.config import can_modify_capcut, get_settings
 from smartcut.core.capcut_draft import TextStyle
 from smartcut.core.capcut_finder import (
@@ -11,10 +16,24 @@ from smartcut.core.capcut_finder import (
     list_projects,
 )
 from smartcut.core.capcut_reader import CapCutProject
+from smartcut.core.models import ProjectInfo, parse_transcription
 from smartcut.tools.analyze import analyze_content
 from smartcut.tools.subtitles import generate_subtitles
 from smartcut.tools.transcribe import transcribe
 
+MAX_CONCURRENT_VIDEOS = 4
+
+# Dumps a whole project listing in one pydantic-core call
+_PROJECT_LIST_ADAPTER = TypeAdapter(list[ProjectInfo])
+
+# One SRT cue: index line, "HH:MM:SS,mmm --> HH:MM:SS,mmm", then text up to a blank line
+_SRT_CUE_RE = re.compile(
+    r"^\s*\d+[ \t]*\n"
+    r"[ \t]*(\d+):(\d+):(\d+)[,.](\d+)[ \t]*-->[ \t]*(\d+):(\d+):(\d+)[,.](\d+)[^\n]*\n"
+    r"([^\n].*?)(?=\n[ \t]*\n|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+
 
 async def list_capcut_projects(
     drafts_dir: Optional[str] = None,
@@ -42,25 +61,17 @@ async def list_capcut_projects(
             "message": "CapCut drafts directory not found. Is CapCut installed?",
         }
 
-    # Get complete projects
-    projects = list_projects(detected_dir, require_content=True)
-
-    # Optionally get incomplete projects too
-    incomplete_count = 0
-    if include_incomplete:
-        all_projects = list_projects(detected_dir, require_content=False)
-        incomplete_count = len(all_projects) - len(projects)
-    else:
-        # Just count incomplete
-        all_projects = list_projects(detected_dir, require_content=False)
-        incomplete_count = len(all_projects) - len(projects)
+    # One scan finds all projects; complete ones are those with draft_info.json
+    all_projects = list_projects(detected_dir, require_content=False)
+    projects = [p for p in all_projects if p.has_content]
+    incomplete_count = len(all_projects) - len(projects)
 
     message = f"Found {len(projects)} projects"
     if incomplete_count > 0:
         message += f" ({incomplete_count} incomplete projects skipped - missing draft_info.json)"
 
     return {
-        "projects": [p.model_dump() for p in projects],
+        "projects": _PROJECT_LIST_ADAPTER.dump_python(projects),
         "drafts_dir": str(detected_dir),
         "count": len(projects),
         "incomplete_count": incomplete_count,
@@ -185,14 +196,15 @@ async def add_subtitles_to_project(
 
         # Get subtitles
         if srt_path:
-            # Parse SRT file
-            subtitles = _parse_srt_file(Path(srt_path))
+            # Parse SRT file off the event loop
+            subtitles = await asyncio.to_thread(_parse_srt_file, Path(srt_path))
         elif transcription_data:
             # Use provided transcription
             subtitles_result = await generate_subtitles(
                 transcription_data=transcription_data,
                 cut_plan_data={"keep_segments": []},  # No cuts, use full timeline
                 style=style,
+                return_srt_content=False,
             )
             subtitles = subtitles_result.get("lines", [])
         else:
@@ -208,6 +220,7 @@ async def add_subtitles_to_project(
                 transcription_data=transcription_result,
                 cut_plan_data={"keep_segments": []},
                 style=style,
+                return_srt_content=False,
             )
             subtitles = subtitles_result.get("lines", [])
 
@@ -295,12 +308,10 @@ async def smart_cut_project(
         original = CapCutProject.load(path)
         original_name = original.project_name
 
-        # Create backup copy
         copy_name = f"{original_name} — SmartCut"
-        project = original.create_copy(copy_name)
 
-        # Get all video sources
-        video_paths = project.get_source_video_paths()
+        # Get all video sources (the copy references the same media files)
+        video_paths = original.get_source_video_paths()
         if not video_paths:
             return {
                 "error": "No video files found in project",
@@ -316,23 +327,59 @@ async def smart_cut_project(
             "videos_processed": 0,
         }
 
-        all_subtitles = []
+        # Clips are independent until their cuts are applied, so process them concurrently
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_VIDEOS)
 
-        for video_path in video_paths:
-            if not video_path.exists():
-                continue
+        async def process_video(video_path: Path) -> tuple[dict, list[dict]]:
+            async with semaphore:
+                # Transcribe
+                transcription = parse_transcription(
+                    await transcribe(str(video_path), language)
+                )
 
-            # Transcribe
-            transcription_result = await transcribe(str(video_path), language)
+                # Analyze
+                analysis_result = await analyze_content(
+                    transcription,
+                    silence_threshold_sec=silence_threshold_sec,
+                    duplicate_detection=detect_duplicates,
+                )
 
-            # Analyze
-            analysis_result = await analyze_content(
-                transcription_result,
-                silence_threshold_sec=silence_threshold_sec,
-                duplicate_detection=detect_duplicates,
-            )
+                # Generate subtitles if requested
+                lines = []
+                if add_subtitles:
+                    subtitles_result = await generate_subtitles(
+                        transcription_data=transcription,
+                        cut_plan_data=analysis_result.get("cut_plan", {}),
+                        style="dynamic",
+                        return_srt_content=False,
+                    )
+                    lines = subtitles_result.get("lines", [])
+
+                return analysis_result.get("cut_plan", {}), lines
+
+        # The same file can be referenced through different paths (symlinks, relative
+        # paths); process each underlying file once and reuse its result
+        existing_paths = []
+        file_keys = []
+        for video_path in video_paths:
+            key = _file_key(video_path)
+            if key is not None:  # Skip missing or unreadable media
+                existing_paths.append(video_path)
+                file_keys.append(key)
+        first_path_by_key = {}
+        for video_path, key in zip(existing_paths, file_keys):
+            first_path_by_key.setdefault(key, video_path)
+
+        # Create the backup copy in a thread while the clips are transcribed
+        unique_results, project = await asyncio.gather(
+            asyncio.gather(*(process_video(p) for p in first_path_by_key.values())),
+            asyncio.to_thread(original.create_copy, copy_name),
+        )
+        result_by_key = dict(zip(first_path_by_key, unique_results))
+        results = [result_by_key[key] for key in file_keys]
 
-            cut_plan = analysis_result.get("cut_plan", {})
+        # Apply cuts in project order
+        for video_path, (cut_plan, lines) in zip(existing_paths, results):
             stats = cut_plan.get("stats", {})
             all_stats["original_duration"] += stats.get("original_duration", 0)
             all_stats["kept_duration"] += stats.get("kept_duration", 0)
@@ -343,23 +390,15 @@ async def smart_cut_project(
             # Apply cuts to video segments in the project
             project.apply_cut_plan(cut_plan, video_path)
 
-            # Generate subtitles if requested
-            if add_subtitles:
-                subtitles_result = await generate_subtitles(
-                    transcription_data=transcription_result,
-                    cut_plan_data=analysis_result.get("cut_plan", {}),
-                    style="dynamic",
-                )
-                all_subtitles.extend(subtitles_result.get("lines", []))
-
-        # Add subtitles if any
-        if all_subtitles:
+        # Add all videos' subtitles as one track, streamed without concatenating
+        subtitles_added = sum(len(lines) for _, lines in results)
+        if subtitles_added:
             text_style = TextStyle(
                 font_size=8,
                 font_color="#FFFFFF",
                 position_y=0.8,
             )
-            project.add_text_track(all_subtitles, text_style)
+            project.add_text_track(chain.from_iterable(lines for _, lines in results), text_style)
 
         project.save()
 
@@ -379,7 +418,7 @@ async def smart_cut_project(
                 "silences_removed": all_stats["silences_removed"],
                 "videos_processed": all_stats["videos_processed"],
             },
-            "subtitles_added": len(all_subtitles) if add_subtitles else 0,
+            "subtitles_added": subtitles_added if add_subtitles else 0,
             "message": f"Smart cut applied to copy '{copy_name}'. Original project unchanged.",
         }
 
@@ -387,50 +426,35 @@ async def smart_cut_project(
         return {"error": f"Failed to process project: {e}"}
 
 
+def _file_key(path: Path) -> Optional[tuple[str, int, int]]:
+    """Identity of a file's contents: resolved path, size and mtime (None if unreadable)."""
+    try:
+        st = path.stat()
+        resolved = str(path.resolve())
+    except OSError:  # Missing, permission denied, unmounted volume, ...
+        return None
+    return resolved, st.st_size, st.st_mtime_ns
+
+
 def _parse_srt_file(srt_path: Path) -> list[dict]:
     """Parse SRT file into subtitle list."""
-    if not srt_path.exists():
+    try:
+        content = srt_path.read_text(encoding="utf-8-sig").replace("\r\n", "\n")
+    except FileNotFoundError:
         return []
 
     subtitles = []
-    content = srt_path.read_text(encoding="utf-8")
-
-    blocks = content.strip().split("\n\n")
-    for block in blocks:
-        lines = block.strip().split("\n")
-        if len(lines) < 3:
-            continue
-
-        # Parse timestamp line
-        timestamp_line = lines[1]
-        if " --> " not in timestamp_line:
-            continue
-
-        start_str, end_str = timestamp_line.split(" --> ")
-        start = _parse_srt_timestamp(start_str)
-        end = _parse_srt_timestamp(end_str)
-
-        # Get text (may be multiple lines)
-        text = " ".join(lines[2:])
-
+    for m in _SRT_CUE_RE.finditer(content):
+        (
+            start_h, start_m, start_s, start_ms,
+            end_h, end_m, end_s, end_ms,
+            text,
+        ) = m.groups()
         subtitles.append({
-            "start": start,
-            "end": end,
-            "text": text,
+            "start": int(start_h) * 3600 + int(start_m) * 60 + float(f"{start_s}.{start_ms}"),
+            "end": int(end_h) * 3600 + int(end_m) * 60 + float(f"{end_s}.{end_ms}"),
+            # Text may span multiple lines
+            "text": text.strip().replace("\n", " "),
         })
 
     return subtitles
-
-
-def _parse_srt_timestamp(ts: str) -> float:
-    """Parse SRT timestamp (HH:MM:SS,mmm) to seconds."""
-    ts = ts.strip().replace(",", ".")
-    parts = ts.split(":")
-    if len(parts) != 3:
-        return 0.0
-
-    hours = int(parts[0])
-    minutes = int(parts[1])
-    seconds = float(parts[2])
-
-    return hours * 3600 + minutes * 60 + seconds
@@ -1,9 +1,11 @@
 """Smart Cut tool - main orchestrator for the full video processing pipeline."""
 
+import asyncio
 from pathlib import Path
 from typing import Literal, Optional
 
 from smartcut.config import SILENCE_THRESHOLD_SEC
+from smartcut.core.models import parse_transcription
 from smartcut.tools.analyze import analyze_content
 from smartcut.tools.capcut_export import generate_capcut_project
 from smartcut.tools.subtitles import generate_subtitles
@@ -42,13 +44,14 @@ async def smart_cut(
     Returns:
         Complete result with transcription, analysis, and output paths.
     """
+    # transcribe() below raises FileNotFoundError for a missing file, so no
+    # separate existence check (and stat) is made here
     path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    stem = path.stem
 
     # Auto-generate project name if not provided
     if not project_name:
-        project_name = f"{path.stem} — SmartCut"
+        project_name = f"{stem} — SmartCut"
 
     result = {
         "input_file": str(path.absolute()),
@@ -66,46 +69,56 @@ async def smart_cut(
     transcription_result = await transcribe(file_path, language)
     result["transcription"] = transcription_result
 
+    # Parse once; the later stages share the model instead of re-parsing the dict
+    transcription = parse_transcription(transcription_result)
+
     # Step 2: Analyze
     analysis_result = await analyze_content(
-        transcription_result,
+        transcription,
         silence_threshold_sec=silence_threshold_sec,
         duplicate_detection=detect_duplicates,
     )
     result["analysis"] = analysis_result
 
-    # Step 3: Generate subtitles if needed
-    srt_path = None
+    # Steps 3-4: subtitles, CapCut project and video export only depend on the
+    # analysis (the CapCut project builds its own subtitles), so run them concurrently
+    cut_plan = analysis_result["cut_plan"]
+    branches = {}
     if add_subtitles:
-        subtitles_result = await generate_subtitles(
-            transcription_data=transcription_result,
-            cut_plan_data=analysis_result["cut_plan"],
+        branches["srt_path"] = generate_subtitles(
+            transcription_data=transcription,
+            cut_plan_data=cut_plan,
             style=subtitle_style,
             output_srt_path=str(path.with_suffix(".srt")),
+            return_srt_content=False,  # Only the file path is reported
         )
-        srt_path = subtitles_result.get("srt_path")
-        result["output"]["srt_path"] = srt_path
 
-    # Step 4: Export based on format
     if output_format in ("capcut", "both"):
-        capcut_result = await generate_capcut_project(
+        branches["capcut_project_path"] = generate_capcut_project(
             file_path=file_path,
-            cut_plan_data=analysis_result["cut_plan"],
+            cut_plan_data=cut_plan,
             project_name=project_name,
             add_subtitles=add_subtitles,
             subtitle_style=subtitle_style,
-            transcription_data=transcription_result,
+            transcription_data=transcription,
         )
-        result["output"]["capcut_project_path"] = capcut_result.get("project_path")
 
     if output_format in ("video", "both"):
-        output_video_path = str(path.with_stem(f"{path.stem}_cut"))
-        video_result = await export_video(
+        output_video_path = str(path.with_stem(f"{stem}_cut"))
+        branches["video_path"] = export_video(
             file_path=file_path,
-            cut_plan_data=analysis_result["cut_plan"],
+            cut_plan_data=cut_plan,
             output_path=output_video_path,
         )
-        result["output"]["video_path"] = video_result.get("output_path")
+
+    branch_results = await asyncio.gather(*branches.values())
+    output_keys = {
+        "srt_path": "srt_path",
+        "capcut_project_path": "project_path",
+        "video_path": "output_path",
+    }
+    for output_key, branch_result in zip(branches, branch_results):
+        result["output"][output_key] = branch_result.get(output_keys[output_key])
 
     # Add summary stats
     stats = analysis_result.get("summary", {})
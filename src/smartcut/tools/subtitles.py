@@ -1,11 +1,22 @@
 """Subtitles tool - generates SRT files and styled CapCut subtitles."""
 
+import asyncio
+from bisect import bisect_left
+from operator import attrgetter
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional, Union
 
 from smartcut.config import SUBTITLE_MAX_CHARS, SUBTITLE_MAX_WORDS, get_settings
-from smartcut.core.llm_client import LLMClient
-from smartcut.core.models import CutSegment, Transcription, TranscriptionWord
+from smartcut.core.accent_words import build_idf, pick_accent_words
+from smartcut.core.llm_client import get_llm_client
+from smartcut.core.models import (
+    CutSegment,
+    Transcription,
+    TranscriptionWord,
+    parse_transcription,
+)
+
+SRT_WRITE_BUFFER_SIZE = 1024 * 1024
 
 
 def map_words_to_timeline(
@@ -22,23 +33,28 @@ def map_words_to_timeline(
     Returns:
         List of words with new timeline positions.
     """
+    # Whisper emits words in order; sort only if a caller passed them unsorted
+    if any(a.start > b.start for a, b in zip(words, words[1:])):
+        words = sorted(words, key=attrgetter("start"))
+    word_starts = [w.start for w in words]
+
     timeline_words = []
     timeline_offset = 0.0
 
     for segment in keep_segments:
-        # Find words that fall within this segment
-        segment_words = [
-            w for w in words
-            if segment.start <= w.start < segment.end
-        ]
+        segment_duration = segment.end - segment.start
+
+        # Words starting inside [segment.start, segment.end)
+        lo = bisect_left(word_starts, segment.start)
+        hi = bisect_left(word_starts, segment.end, lo)
 
-        for word in segment_words:
+        for word in words[lo:hi]:
             # Calculate new position on timeline
             relative_start = word.start - segment.start
             relative_end = word.end - segment.start
 
             # Clamp to segment bounds
-            relative_end = min(relative_end, segment.end - segment.start)
+            relative_end = min(relative_end, segment_duration)
 
             timeline_words.append({
                 "word": word.word,
@@ -46,7 +62,7 @@ def map_words_to_timeline(
                 "end": timeline_offset + relative_end,
             })
 
-        timeline_offset += segment.end - segment.start
+        timeline_offset += segment_duration
 
     return timeline_words
 
@@ -72,32 +88,38 @@ def group_words_into_lines(
 
     lines = []
     current_line_words = []
-    current_line_text = ""
+    current_line_parts = []  # Non-empty word texts, joined once per line
+    current_line_len = 0  # len(" ".join(current_line_parts))
 
     for word in words:
         word_text = word["word"].strip()
-        test_text = f"{current_line_text} {word_text}".strip()
+        separator = 1 if current_line_len and word_text else 0
+        test_len = current_line_len + separator + len(word_text)
 
         # Check if adding this word exceeds limits
-        if (len(current_line_words) >= max_words or len(test_text) > max_chars) and current_line_words:
+        if (len(current_line_words) >= max_words or test_len > max_chars) and current_line_words:
             # Finalize current line
             lines.append({
                 "start": current_line_words[0]["start"],
                 "end": current_line_words[-1]["end"],
-                "text": current_line_text,
+                "text": " ".join(current_line_parts),
             })
             current_line_words = []
-            current_line_text = ""
+            current_line_parts = []
+            current_line_len = 0
+            separator = 0
 
         current_line_words.append(word)
-        current_line_text = f"{current_line_text} {word_text}".strip()
+        if word_text:
+            current_line_parts.append(word_text)
+            current_line_len += separator + len(word_text)
 
     # Add final line
     if current_line_words:
         lines.append({
             "start": current_line_words[0]["start"],
             "end": current_line_words[-1]["end"],
-            "text": current_line_text,
+            "text": " ".join(current_line_parts),
         })
 
     return lines
@@ -105,57 +127,69 @@ def group_words_into_lines(
 
 def format_srt_timestamp(seconds: float) -> str:
     """Format seconds as SRT timestamp (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    # Integer milliseconds first, so the fields come from exact int divmods
+    secs, millis = divmod(int(seconds * 1000), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
+def _srt_cues(lines: list[dict]) -> Iterator[str]:
+    """Yield one formatted SRT cue per subtitle line (without the blank separator line)."""
+    for i, line in enumerate(lines, start=1):
+        yield (
+            f"{i}\n"
+            f"{format_srt_timestamp(line['start'])} --> {format_srt_timestamp(line['end'])}\n"
+            f"{line['text']}\n"
+        )
+
+
 def generate_srt_content(lines: list[dict]) -> str:
     """Generate SRT file content from subtitle lines."""
-    srt_lines = []
-
-    for i, line in enumerate(lines, start=1):
-        start_ts = format_srt_timestamp(line["start"])
-        end_ts = format_srt_timestamp(line["end"])
+    # The joining newline supplies the blank separator line
+    return "\n".join(_srt_cues(lines))
 
-        srt_lines.append(str(i))
-        srt_lines.append(f"{start_ts} --> {end_ts}")
-        srt_lines.append(line["text"])
-        srt_lines.append("")
 
-    return "\n".join(srt_lines)
+def write_srt_file(path: Path, lines: list[dict]) -> None:
+    """Write subtitle lines as an SRT file cue by cue, without building the whole content."""
+    with path.open("w", encoding="utf-8", buffering=SRT_WRITE_BUFFER_SIZE) as f:
+        for i, cue in enumerate(_srt_cues(lines)):
+            if i:
+                f.write("\n")
+            f.write(cue)
 
 
 async def generate_subtitles(
-    transcription_data: dict,
+    transcription_data: Union[dict, Transcription],
     cut_plan_data: dict,
     style: Literal["dynamic", "simple"] = "dynamic",
     output_srt_path: Optional[str] = None,
     identify_accents: bool = True,
+    return_srt_content: bool = True,
 ) -> dict:
     """
     Generate subtitles from transcription aligned to cut plan.
 
     Args:
-        transcription_data: Transcription data from transcribe tool.
+        transcription_data: Transcription data from transcribe tool (or a parsed Transcription).
         cut_plan_data: Cut plan from analyze_content tool.
         style: Subtitle style - 'dynamic' (with accents) or 'simple'.
         output_srt_path: Path for SRT file output.
         identify_accents: Whether to identify accent words for dynamic style.
+        return_srt_content: Whether to include the SRT text in the result. Callers
+            that only need the file or the lines can skip building it.
 
     Returns:
         Subtitle generation result with file path and statistics.
     """
-    transcription = Transcription(**transcription_data)
+    transcription = parse_transcription(transcription_data)
     keep_segments = [
         CutSegment(**s) for s in cut_plan_data.get("keep_segments", [])
     ]
 
     # Map words to timeline
     timeline_words = map_words_to_timeline(
-        transcription.get_all_words(),
+        transcription.all_words,
         keep_segments,
     )
 
@@ -176,22 +210,36 @@ async def generate_subtitles(
         settings = get_settings()
         if settings.openai_api_key:
             try:
-                llm = LLMClient(settings.openai_api_key)
-                for line in subtitle_lines:
-                    accents = llm.identify_accent_words(line["text"])
+                llm = get_llm_client(settings.openai_api_key)
+                # Lines are packed into a few concurrent requests instead of one call each
+                all_accents = await llm.identify_accent_words_batch_async(
+                    [line["text"] for line in subtitle_lines]
+                )
+                for line, accents in zip(subtitle_lines, all_accents):
                     line["accent_words"] = accents
                     accent_words_count += len(accents)
             except Exception as e:
                 # Continue without accents on error
                 print(f"Warning: Accent identification failed: {e}")
-
-    # Generate SRT file
-    srt_content = generate_srt_content(subtitle_lines)
+        else:
+            # No API key - score words locally against the whole transcript
+            idf = build_idf(line["text"] for line in subtitle_lines)
+            for line in subtitle_lines:
+                text = line["text"]
+                accents = pick_accent_words(text, idf) if len(text.split()) >= 3 else []
+                line["accent_words"] = accents
+                accent_words_count += len(accents)
+
+    # Generate SRT file; without the in-memory content it is streamed cue by cue
+    srt_content = generate_srt_content(subtitle_lines) if return_srt_content else None
     srt_path = None
 
     if output_srt_path:
         srt_path = Path(output_srt_path)
-        srt_path.write_text(srt_content, encoding="utf-8")
+        if srt_content is not None:
+            await asyncio.to_thread(srt_path.write_text, srt_content, encoding="utf-8")
+        else:
+            await asyncio.to_thread(write_srt_file, srt_path, subtitle_lines)
 
     return {
         "srt_path": str(srt_path) if srt_path else None,
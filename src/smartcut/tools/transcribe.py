@@ -1,5 +1,8 @@
 """Transcribe tool - transcribes video/audio using Whisper API."""
 
+import asyncio
+import hashlib
+import os
 import tempfile
 from pathlib import Path
 from typing import Optional
@@ -9,6 +12,8 @@ from smartcut.core.ffmpeg_utils import check_ffmpeg_installed, extract_audio
 from smartcut.core.models import Transcription
 from smartcut.core.whisper_client import WhisperClient
 
+FINGERPRINT_BLOCK_SIZE = 1024 * 1024
+
 
 async def transcribe(
     file_path: str,
@@ -24,10 +29,12 @@ async def transcribe(
     Returns:
         Transcription result with segments and word-level timestamps.
     """
-    # Validate file exists
+    # Validate file exists; the stat is reused for the cache fingerprint
     path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
     # Check FFmpeg
     if not check_ffmpeg_installed():
@@ -41,18 +48,61 @@ async def transcribe(
     if not settings.openai_api_key:
         raise RuntimeError("OPENAI_API_KEY environment variable is not set")
 
-    # Extract audio to temp file
-    with tempfile.TemporaryDirectory() as temp_dir:
-        audio_path = Path(temp_dir) / "audio.wav"
-        extract_audio(path, audio_path)
-
-        # Transcribe
-        client = WhisperClient(settings.openai_api_key)
-        transcription = client.transcribe(audio_path, language)
+    # FFmpeg and the Whisper upload block, so run them off the event loop
+    transcription = await asyncio.to_thread(
+        _transcribe_file, path, language, settings.openai_api_key, st
+    )
 
     return transcription.model_dump()
 
 
+def _source_fingerprint(path: Path, st: Optional[os.stat_result] = None) -> str:
+    """
+    Cheap content fingerprint of a source file.
+
+    Hashes size, mtime and the first and last MiB instead of the whole file,
+    which for multi-GB videos would cost as much as extracting the audio.
+    An edit confined to the middle of the file that keeps both size and mtime
+    (e.g. a tool that restores timestamps) is not detected and returns the
+    previous transcript; touch the file to force a fresh transcription.
+    """
+    if st is None:
+        st = path.stat()
+    digest = hashlib.blake2b(f"{st.st_size}:{st.st_mtime_ns}".encode())
+    with open(path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_BLOCK_SIZE))
+        if st.st_size > FINGERPRINT_BLOCK_SIZE:
+            f.seek(max(st.st_size - FINGERPRINT_BLOCK_SIZE, FINGERPRINT_BLOCK_SIZE))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _transcribe_file(
+    path: Path,
+    language: Optional[str],
+    api_key: str,
+    st: Optional[os.stat_result] = None,
+) -> Transcription:
+    """Extract audio to a temp file and transcribe it, reusing cached results."""
+    client = WhisperClient(api_key)
+
+    # A hit on the source fingerprint skips audio extraction as well as the Whisper call
+    fingerprint = None
+    if client.cache is not None:
+        fingerprint = _source_fingerprint(path, st)
+        cached = client.cached_for_source(fingerprint, language)
+        if cached is not None:
+            return cached
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Lossless FLAC is about half the size of PCM WAV, so there is less to
+        # write, hash and upload, and fewer files cross the chunking limit
+        audio_path = Path(temp_dir) / "audio.flac"
+        extract_audio(path, audio_path, codec="flac")
+
+        return client.transcribe(audio_path, language, source_fingerprint=fingerprint)
+
+
 def format_transcription_result(transcription: Transcription) -> dict:
     """Format transcription for tool output."""
     return {
@@ -1,14 +1,13 @@
 """Video Export tool - exports cut video using FFmpeg."""
 
-import tempfile
+import asyncio
 from pathlib import Path
 from typing import Optional
 
 from smartcut.config import can_modify_source
 from smartcut.core.ffmpeg_utils import (
     check_ffmpeg_installed,
-    concat_segments,
-    cut_segment,
+    cut_and_concat,
     get_file_format,
     get_media_info,
 )
@@ -43,8 +42,10 @@ async def export_video(
         }
 
     path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
     if not check_ffmpeg_installed():
         raise RuntimeError(
@@ -69,28 +70,15 @@ async def export_video(
         output_suffix = f".{original_format}" if preserve_format else ".mp4"
         out_path = path.with_stem(f"{path.stem}_cut").with_suffix(output_suffix)
 
-    # Get media info for duration calculation
-    media_info = get_media_info(path)
-
-    # Cut and concatenate segments
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        segment_paths = []
-
-        # Cut each segment
-        for i, segment in enumerate(keep_segments):
-            segment_path = temp_path / f"segment_{i:04d}{path.suffix}"
-            cut_segment(
-                input_path=path,
-                output_path=segment_path,
-                start=segment.start,
-                end=segment.end,
-                stream_copy=True,
-            )
-            segment_paths.append(segment_path)
-
-        # Concatenate all segments
-        concat_segments(segment_paths, out_path)
+    # Probe the source itself: the cut plan's original_duration is the transcribed
+    # audio length, which can differ from the container. Probes are cached per
+    # file, so a pipeline that already probed this file doesn't run ffprobe again.
+    original_duration = (await asyncio.to_thread(get_media_info, path, st)).duration
+
+    # Cut and concatenate segments in one FFmpeg pass, off the event loop
+    await asyncio.to_thread(
+        cut_and_concat, path, [(s.start, s.end) for s in keep_segments], out_path
+    )
 
     # Calculate output duration
     output_duration = sum(s.end - s.start for s in keep_segments)
@@ -101,6 +89,6 @@ async def export_video(
         "duration_formatted": f"{int(output_duration // 60)}:{int(output_duration % 60):02d}",
         "format": get_file_format(out_path),
         "segments_count": len(keep_segments),
-        "original_duration": media_info.duration,
-        "time_saved": media_info.duration - output_duration,
+        "original_duration": original_duration,
+        "time_saved": original_duration - output_duration,
     }